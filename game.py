@@ -1,6 +1,5 @@
 import pygame
 import sys
-import time
 
 import tictactoe as ttt
 
@@ -18,52 +17,89 @@ mediumFont = pygame.font.Font("OpenSans-Regular.ttf", 28)
 largeFont = pygame.font.Font("OpenSans-Regular.ttf", 40)
 moveFont = pygame.font.Font("OpenSans-Regular.ttf", 60)
 
+# Rendered text surfaces by (text, font, color, background); the labels hardly change, so each is rasterized once
+text_cache = {}
+
+
+def render_text(font, text, color, background):
+    # All text sits on a solid color, so render it opaque onto that color and convert it to the display
+    # format: blits are then plain copies without per-pixel alpha blending
+    key = (text, id(font), color, background)
+    surface = text_cache.get(key)
+    if surface is None:
+        surface = font.render(text, True, color, background).convert()
+        text_cache[key] = surface
+    return surface
+
+
 game_mode = None  # None = not selected, AI , 2P
 user = None
 board = ttt.initial_state()
 ai_turn = False
+ai_move_at = 0  # pygame.time.get_ticks() time at which the AI plays
+clock = pygame.time.Clock()
+shown = None  # (game_mode, user, board, ai_turn) of the frame on the display
+
+# The window size is fixed, so buttons and tiles are laid out once, for drawing and click checks alike
+vsAIButton = pygame.Rect(1.5 * (width / 8), (height / 2), (width / 4), 80)  # rectangular object
+play2Button = pygame.Rect(4.5 * (width / 8), (height / 2), (width / 4), 80)
+playXButton = pygame.Rect((width / 8), (height / 2), width / 4, 80)
+playOButton = pygame.Rect(5 * (width / 8), (height / 2), width / 4, 80)
+againButton = pygame.Rect(width / 3, height - 65, width / 3, 50)
+
+tile_size = width / 6
+tile_origin = (width / 2 - (1.5 * tile_size),
+               height / 2 - (1.5 * tile_size))
+tiles = [
+    [pygame.Rect(tile_origin[0] + j * tile_size, tile_origin[1] + i * tile_size, tile_size, tile_size)
+     for j in range(3)]
+    for i in range(3)
+]
 
 while True:
 
+    # Position of this frame's left click, if any; one event per click, so no debounce is needed
+    mouse = None
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             sys.exit()
-
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mouse = event.pos
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWSHOWN, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+            shown = None  # The window was uncovered or restored, so flip the next frame even if nothing changed
+
+    # Everything drawn depends only on the state at this point, so frames showing the same state are not
+    # pushed to the display again
+    frame = (game_mode, user, board, ai_turn)
     screen.fill(blue)
 
     # Let user choose game mode
     if game_mode is None:
 
         # Draw title
-        title = largeFont.render("Play Tic-Tac-Toe", True, white)
+        title = render_text(largeFont, "Play Tic-Tac-Toe", white, blue)
         titleRect = title.get_rect()  # to create a rectangular object for text surface
         titleRect.center = (width // 2, 50)
         screen.blit(title, titleRect)  # to draw an image
 
         # Draw game mode buttons
-        vsAIButton = pygame.Rect(1.5 * (width / 8), (height / 2), (width / 4), 80)  # rectangular object
-        vsAI = mediumFont.render("vs AI", True, black)  # Text
+        vsAI = render_text(mediumFont, "vs AI", black, white)  # Text
         vsAIRect = vsAI.get_rect()
         vsAIRect.center = vsAIButton.center
         pygame.draw.rect(screen, white, vsAIButton)  # draw a rectangle
         screen.blit(vsAI, vsAIRect)
 
-        play2Button = pygame.Rect(4.5 * (width / 8), (height / 2), (width / 4), 80)
-        play2 = mediumFont.render("2 Players", True, black)
+        play2 = render_text(mediumFont, "2 Players", black, white)
         play2Rect = play2.get_rect()
         play2Rect.center = play2Button.center
         pygame.draw.rect(screen, white, play2Button)
         screen.blit(play2, play2Rect)
 
         # Check if button is clicked
-        click, _, _ = pygame.mouse.get_pressed()  # get the state of the mouse buttons
-        if click == 1:
-            mouse = pygame.mouse.get_pos()  # get the mouse cursor position
+        if mouse is not None:
             if vsAIButton.collidepoint(mouse):
-                time.sleep(0.2)
                 game_mode = "AI"
             elif play2Button.collidepoint(mouse):  # test if the clicked point is inside the rectangle
-                time.sleep(0.2)
                 game_mode = "2P"
                 user = ttt.X
 
@@ -71,61 +107,44 @@ while True:
     elif user is None and game_mode == "AI":
 
         # Draw title
-        title = largeFont.render("Play Tic-Tac-Toe vs AI", True, white)
+        title = render_text(largeFont, "Play Tic-Tac-Toe vs AI", white, blue)
         titleRect = title.get_rect()
         titleRect.center = ((width / 2), 50)
         screen.blit(title, titleRect)
 
         # Draw buttons
-        playXButton = pygame.Rect((width / 8), (height / 2), width / 4, 80)
-        playX = mediumFont.render("Play as X", True, black)
+        playX = render_text(mediumFont, "Play as X", black, white)
         playXRect = playX.get_rect()
         playXRect.center = playXButton.center
         pygame.draw.rect(screen, white, playXButton)
         screen.blit(playX, playXRect)
 
-        playOButton = pygame.Rect(5 * (width / 8), (height / 2), width / 4, 80)
-        playO = mediumFont.render("Play as O", True, black)
+        playO = render_text(mediumFont, "Play as O", black, white)
         playORect = playO.get_rect()
         playORect.center = playOButton.center
         pygame.draw.rect(screen, white, playOButton)
         screen.blit(playO, playORect)
 
         # Check if button is clicked
-        click, _, _ = pygame.mouse.get_pressed()
-        if click == 1:
-            mouse = pygame.mouse.get_pos()
+        if mouse is not None:
             if playXButton.collidepoint(mouse):
-                time.sleep(0.2)
                 user = ttt.X
             elif playOButton.collidepoint(mouse):
-                time.sleep(0.2)
                 user = ttt.O
 
     else:  # (game_mode = 2P) or (AI and user)
 
         # Draw game board
-        tile_size = width / 6
-        tile_origin = (width / 2 - (1.5 * tile_size),
-                       height / 2 - (1.5 * tile_size))
-        tiles = []
         for i in range(3):
-            row = []
             for j in range(3):
-                rect = pygame.Rect(
-                    tile_origin[0] + j * tile_size,
-                    tile_origin[1] + i * tile_size,
-                    tile_size, tile_size
-                )
+                rect = tiles[i][j]
                 pygame.draw.rect(screen, white, rect, 3)
 
                 if board[i][j] != ttt.EMPTY:
-                    move = moveFont.render(board[i][j], True, white)
+                    move = render_text(moveFont, board[i][j], white, blue)
                     moveRect = move.get_rect()
                     moveRect.center = rect.center
                     screen.blit(move, moveRect)
-                row.append(rect)
-            tiles.append(row)
 
         game_over = ttt.terminal(board)
         player = ttt.player(board)
@@ -143,7 +162,7 @@ while True:
             title = f"Play as {user}"
         else:
             title = f"Computer thinking..."
-        title = largeFont.render(title, True, white)
+        title = render_text(largeFont, title, white, blue)
         titleRect = title.get_rect()
         titleRect.center = ((width / 2), 30)
         screen.blit(title, titleRect)
@@ -151,18 +170,18 @@ while True:
         # Check for AI move (AI mode)
         if game_mode == "AI" and user != player and not game_over:
             if ai_turn:
-                time.sleep(0.5)
-                move = ttt.minimax(board)  # using algorithm for bot here
-                board = ttt.result(board, move)
-                ai_turn = False
+                # Wait without blocking the loop, so the window keeps responding
+                if pygame.time.get_ticks() >= ai_move_at:
+                    move = ttt.minimax(board)  # using algorithm for bot here
+                    board = ttt.result(board, move)
+                    ai_turn = False
             else:
                 ai_turn = True
+                ai_move_at = pygame.time.get_ticks() + 500
 
         # Check for a user move
-        click, _, _ = pygame.mouse.get_pressed()
-        # if click == 1 and user == player and not game_over:
-        if click == 1 and not game_over:
-            mouse = pygame.mouse.get_pos()
+        # if mouse is not None and user == player and not game_over:
+        if mouse is not None and not game_over:
             for i in range(3):
                 for j in range(3):
                     if (board[i][j] == ttt.EMPTY and tiles[i][j].collidepoint(mouse)):
@@ -173,23 +192,22 @@ while True:
 
         # game over terminal - Play again button
         if game_over:
-            againButton = pygame.Rect(width / 3, height - 65, width / 3, 50)
-            again = mediumFont.render("Play Again", True, black)
+            again = render_text(mediumFont, "Play Again", black, white)
             againRect = again.get_rect()
             againRect.center = againButton.center
             pygame.draw.rect(screen, white, againButton)
             screen.blit(again, againRect)
-            click, _, _ = pygame.mouse.get_pressed()
-            if click == 1:
-                mouse = pygame.mouse.get_pos()
+            if mouse is not None:
                 if againButton.collidepoint(mouse):
-                    time.sleep(0.2)
                     game_mode = None
                     user = None
                     board = ttt.initial_state()
                     ai_turn = False
 
-    pygame.display.flip()
+    if frame != shown:
+        pygame.display.flip()
+        shown = frame
+    clock.tick(30)  # Turn-based game, no need to redraw faster
 
     """
     improvement:
@@ -1,10 +1,78 @@
+import atexit
+import gc
+import heapq
 import json
-import tictactoe as ttt
-import pygame
+import logging
+import os
+import queue
 import sys
+import threading
 import time
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 
+import tictactoe as ttt
+
+# Blend per-pixel alpha text with SDL2's blitters instead of pygame's own. Set it before pygame is
+# imported, so it is in place whenever pygame reads it.
+os.environ.setdefault("PYGAME_BLEND_ALPHA_SDL2", "1")
+import pygame  # noqa: E402
+
+try:
+    import orjson  # Optional, faster JSON parsing and encoding
+except ImportError:
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+# The other player's symbol, for each symbol
+OPPONENT = {ttt.X: ttt.O, ttt.O: ttt.X}
+
+# Events after which the window contents have to be drawn again (uncovered, shown or restored); pygame 2.0.1+
+# reports window changes as separate WINDOW* event types instead of a single WINDOWEVENT
+REDRAW_EVENTS = tuple(
+    getattr(pygame, name)
+    for name in ("VIDEOEXPOSE", "WINDOWEVENT", "WINDOWSHOWN", "WINDOWEXPOSED", "WINDOWRESTORED")
+    if hasattr(pygame, name)
+)
+
+
+def _read_json(path):
+    """Reads and parses a JSON file, using orjson when it is installed.
+
+    Args:
+        path (str or Path): The file to read.
+
+    Returns:
+        The parsed JSON data.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If the file is not valid JSON (orjson's error is a subclass of it).
+    """
+
+    # Read the whole file as bytes and parse it in one go, without a text-mode wrapper
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(path, data):
+    """Writes data to a file as compact JSON, using orjson when it is installed.
+
+    Args:
+        path (str or Path): The file to write.
+        data: The JSON-serializable data to write.
+    """
+
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data))
+    else:
+        Path(path).write_text(json.dumps(data, separators=(",", ":")))
+
 
 class GameState:
     """Represents the different states of the game.
@@ -52,11 +120,27 @@ class Colors:
     GREY = (128, 128, 128)
 
 
+@dataclass
+class Notification:
+    """A message shown on screen until it expires.
+
+    Attributes:
+        text (str): The message to show.
+        expires_ms (int): The `pygame.time.get_ticks()` time at which the message disappears.
+    """
+
+    text: str
+    expires_ms: int
+
+
 class ThemeManager:
     """Manages themes for a game, including loading, saving, and applying themes.
 
     Attributes:
         theme_file (str): The path to the JSON file containing theme data.
+        current_theme_file (Path): The JSON file the selected theme is saved to, next to `theme_file`.
+        legacy_theme_file (Path): The file older versions saved the selected theme to, read once if
+            `current_theme_file` does not exist yet.
         themes (dict): A dictionary containing theme configurations.
         current_theme (str): The currently selected theme.
 
@@ -66,18 +150,21 @@ class ThemeManager:
         
         save_theme():
             Saves the currently selected theme to a file.
+
+        set_theme(theme_name):
+            Switches to a theme and saves the choice, if it is not already active.
         
         load_current_theme():
             Loads the current theme from a save file.
         
-        load_theme():
-            An alternate method to load the current theme.
-        
         apply_theme():
             Applies the currently selected theme to the game.
         
         get_theme():
             Returns the active theme's data.
+
+        theme_names():
+            Returns the names of the available themes.
     """
 
 
@@ -90,8 +177,14 @@ class ThemeManager:
         """
 
         self.theme_file = theme_file
+        self.current_theme_file = Path(theme_file).with_name("current_theme.json")
+        self.legacy_theme_file = Path("theme.json")  # Where older versions saved the selection, migrated on load
         self.themes = {}
         self.current_theme = default_theme
+        self._active = None  # Resolved colors of the active theme, see get_theme()
+        self._active_name = None  # Theme name _active was resolved for
+        self._theme_index = None  # Theme names in file order
+        # The layout needs the theme names at start-up anyway, so there is nothing to gain from loading lazily
         self.load_themes()
         self.load_current_theme()
         
@@ -99,20 +192,17 @@ class ThemeManager:
     def load_themes(self):
         """Loads theme data from the specified theme file.
 
-        Tries to read the theme configurations from the JSON file at `theme_file`. If the file is not found,
-        a default theme is returned.
-
-        Returns:
-            dict: A dictionary of themes if successfully loaded, or the default theme dictionary otherwise.
+        Tries to read the theme configurations from the JSON file at `theme_file` into `themes`. If the file is not
+        found, `themes` is set to a default "Classic" theme. Color lists are converted to tuples once here, so draw
+        calls get a ready color and the renderer can use colors in its cache keys.
         """
 
         themes_path = Path(self.theme_file)  # Path to the JSON file
         try:
-            with themes_path.open("r") as f:
-                self.themes = json.load(f)
+            self.themes = _read_json(themes_path)
         except FileNotFoundError:
-            print(f"{themes_path} file not found. Using default themes.")
-            return {
+            logger.warning("%s file not found. Using default themes.", themes_path)
+            self.themes = {
                 "Classic": {
                     "background": [30, 30, 30],
                     "grid_color": [255, 255, 255],
@@ -123,43 +213,64 @@ class ThemeManager:
                     "button_text_color": [255, 255, 255],
                 }
             }
+
+        for theme in self.themes.values():
+            for key, value in theme.items():
+                if isinstance(value, list):
+                    theme[key] = tuple(value)
         
 
     def save_theme(self):
         """Saves the currently selected theme to a file.
 
-        Writes the `current_theme` to the `theme.json` file.
+        Writes the `current_theme` to `current_theme_file`.
         """
 
 
-        with open("theme.json", "w") as f:
-            json.dump({"current_theme": self.current_theme}, f)
+        self._active = None
+        _write_json(self.current_theme_file, {"current_theme": self.current_theme})
 
 
-    def load_current_theme(self):
-        """Loads the current theme from a save file.
+    def set_theme(self, theme_name):
+        """Switches to a theme and saves the choice, if it is not already active.
+
+        Meant to be called once per click, so the theme file is written once per actual change.
+
+        Args:
+            theme_name (str): The name of the theme to switch to.
 
-        Reads the `current_theme` from the `theme.json` file. If the file is not found, defaults to "Classic".
+        Returns:
+            bool: True if the theme changed, False if it was already active.
         """
 
-        try:
-            with open("theme.json", "r") as f:
-                self.current_theme = json.load(f).get("current_theme", "Classic")
-        except FileNotFoundError:
-            print("Theme save file not found. Defaulting to 'Classic'.")
+        if theme_name == self.current_theme:
+            return False
+        self.current_theme = theme_name
+        self.save_theme()  # Also drops the memoized theme colors
+        return True
 
 
-    def load_theme(self):
-        """Loads the current theme from a save file (alternate method).
+    def load_current_theme(self):
+        """Loads the current theme from a save file.
 
-        Reads the `current_theme` from the `theme.json` file. Defaults to "Classic" if the file is missing.
+        Reads the `current_theme` from `current_theme_file`, the same file save_theme() writes. If that file is
+        not found, a selection saved by an older version in `legacy_theme_file` is moved over once. If neither
+        exists, keeps the default theme.
         """
 
         try:
-            with open("theme.json", "r") as f:
-                self.current_theme = json.load(f).get("current_theme", "Classic")
+            self.current_theme = _read_json(self.current_theme_file).get("current_theme", "Classic")
+            return
         except FileNotFoundError:
-            self.current_theme = "Classic"  # Default to "Classic" if the file is missing
+            pass
+
+        try:
+            self.current_theme = _read_json(self.legacy_theme_file).get("current_theme", "Classic")
+        except (FileNotFoundError, json.JSONDecodeError):
+            logger.info("Theme save file not found. Defaulting to 'Classic'.")
+            return
+        self.save_theme()
+        self.legacy_theme_file.unlink(missing_ok=True)
 
 
     def apply_theme(self):
@@ -176,13 +287,28 @@ class ThemeManager:
         """Returns the active theme's data.
 
         Fetches the data for the currently selected theme. If the theme does not exist, defaults to "Classic".
+        The result is resolved once per theme change.
 
         Returns:
             dict: The active theme's configuration.
         """
 
-        return self.themes.get(self.current_theme, self.themes.get("Classic", {}))
+        if self._active is None or self._active_name != self.current_theme:
+            self._active = self.themes.get(self.current_theme, self.themes.get("Classic", {}))
+            self._active_name = self.current_theme
+        return self._active
+
 
+    def theme_names(self):
+        """Returns the names of the available themes.
+
+        Returns:
+            tuple: The theme names, in the order they appear in the theme file.
+        """
+
+        if self._theme_index is None:
+            self._theme_index = tuple(self.themes)
+        return self._theme_index
 
 class StorageManager:
     """Manages the storage of player statistics, including initialization, loading, saving, and updating stats.
@@ -190,6 +316,8 @@ class StorageManager:
     Attributes:
         data_folder (Path): The path to the folder where player statistics are stored.
         data_file (Path): The path to the JSON file containing player statistics.
+        revision (int): Counter bumped whenever the in-memory statistics change, for cache invalidation.
+        flush_delay (float): Seconds an update may wait in memory before maybe_flush() writes it out.
 
     Methods:
         initialize_storage():
@@ -203,18 +331,39 @@ class StorageManager:
         
         update_player_stats(player_name, won=False, tied=False):
             Updates the statistics for a specific player based on the game's outcome.
+
+        invalidate():
+            Drops the in-memory statistics so the next load re-reads the stats file.
+
+        maybe_flush():
+            Writes pending statistics to disk once the flush delay has passed.
+
+        flush():
+            Writes pending statistics to disk immediately.
+
+        top_players(count=10):
+            Returns the players with the most wins.
     """
 
-    def __init__(self, data_folder="game_data"):
+    def __init__(self, data_folder="game_data", flush_delay=5.0):
         """Initializes the StorageManager.
 
         Args:
             data_folder (str): The path to the folder where game data is stored. Defaults to "game_data".
+            flush_delay (float): Seconds to batch stat updates before writing them. Defaults to 5.0.
         """
 
         self.data_folder = Path(data_folder)
         self.data_file = self.data_folder / "player_stats.json"
+        self.revision = 0
+        self.flush_delay = flush_delay
+        self._stats_cache = None  # Parsed stats file, kept in memory between reads and writes
+        self._dirty = False  # In-memory stats have changes not yet written to disk
+        self._flush_due = 0  # time.monotonic() at which pending changes should be written
+        self._ranking = None  # (revision, count, top players) from the last top_players() call
+        self._stats_mtime = None  # Stats file mtime (ns) when it was last read or written by this class
         self.initialize_storage()
+        atexit.register(self.flush)  # Don't lose updates still waiting for the flush delay
         
 
     def initialize_storage(self):
@@ -226,31 +375,36 @@ class StorageManager:
         self.data_folder.mkdir(exist_ok=True)
         if not self.data_file.exists():
             initiated = {}
-            with open(self.data_file, 'w') as f:
-                json.dump(initiated, f)
+            _write_json(self.data_file, initiated)
 
 
     def load_stats(self):
         """Loads player statistics from the stats file.
 
         Tries to read player statistics from the JSON file. If the file is missing or corrupted, it creates a new empty file.
+        The file is only parsed again when its modification time shows it was changed by someone else; otherwise
+        later calls return the cached dictionary. Updates not flushed yet take precedence over external changes.
 
         Returns:
             dict: A dictionary of player statistics. If the file is empty or missing, returns an empty dictionary.
         """
 
+        if self._stats_cache is not None:
+            if self._dirty or self._file_mtime() == self._stats_mtime:
+                return self._stats_cache
+
         try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
-                if not data:  # Handle empty file case
-                    return {}
-                return data
+            data = _read_json(self.data_file)
+            if not data:  # Handle empty file case
+                data = {}
         except (FileNotFoundError, json.JSONDecodeError):
             # If file doesn't exist or is corrupted, create new one
-            initial_data = {}
-            with open(self.data_file, 'w') as f:
-                json.dump(initial_data, f)
-            return initial_data
+            data = {}
+            _write_json(self.data_file, data)
+        self._stats_cache = data
+        self._stats_mtime = self._file_mtime()
+        self.revision += 1
+        return data
         
 
     def save_stats(self, stats):
@@ -260,15 +414,29 @@ class StorageManager:
             stats (dict): A dictionary containing player statistics to be saved.
         """
 
-        with open(self.data_file, 'w') as f:
-            json.dump(stats, f, indent=4)
+        if stats is not self._stats_cache:
+            self._stats_cache = stats
+            self.revision += 1
+        self._dirty = False
+        # Compact JSON: the file is only read back by this class
+        _write_json(self.data_file, stats)
+        self._stats_mtime = self._file_mtime()
+
+
+    def _file_mtime(self):
+        """Returns the stats file's modification time in nanoseconds, or None if it does not exist."""
+
+        try:
+            return self.data_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
 
 
     def update_player_stats(self, player_name, won=False, tied=False):
         """Updates the statistics for a specific player based on the game's outcome.
 
         If the player does not exist in the stats, a new entry is created. Updates are made based on whether the player
-        won, lost, or tied the game.
+        won, lost, or tied the game. The change is kept in memory and written to disk later by maybe_flush() or flush().
 
         Args:
             player_name (str): The name of the player whose stats are being updated.
@@ -282,15 +450,67 @@ class StorageManager:
 
         if tied:
             stats[player_name]["ties"] += 1
-            print("tie")
+            logger.debug("%s: tie", player_name)
         elif won:
             stats[player_name]["wins"] += 1
-            print("win")
+            logger.debug("%s: win", player_name)
         else:
             stats[player_name]["losses"] += 1
-            print("loss")
+            logger.debug("%s: loss", player_name)
+
+        self.revision += 1
+        if not self._dirty:
+            self._dirty = True
+            self._flush_due = time.monotonic() + self.flush_delay
+
 
-        self.save_stats(stats)
+    def invalidate(self):
+        """Drops the in-memory statistics so the next load_stats() call re-reads the stats file.
+
+        Call this after the stats file has been changed by something other than this StorageManager. Updates that were
+        not flushed yet are discarded.
+        """
+
+        self._stats_cache = None
+        self._dirty = False
+        self.revision += 1
+
+
+    def maybe_flush(self):
+        """Writes pending statistics to disk once the flush delay has passed.
+
+        Cheap enough to call once per main-loop iteration.
+        """
+
+        if self._dirty and time.monotonic() >= self._flush_due:
+            self.flush()
+
+
+    def flush(self):
+        """Writes pending statistics to disk immediately, if there are any."""
+
+        if self._dirty:
+            self.save_stats(self._stats_cache)
+
+
+    def top_players(self, count=10):
+        """Returns the players with the most wins.
+
+        The ranking is only recomputed after the statistics changed.
+
+        Args:
+            count (int): The maximum number of players to return. Defaults to 10.
+
+        Returns:
+            list: (name, wins) tuples, highest number of wins first.
+        """
+
+        stats = self.load_stats()
+        if self._ranking is None or self._ranking[:2] != (self.revision, count):
+            # Partial selection instead of a full sort, skipping invalid entries
+            players = ((name, int(data.get("wins", 0))) for name, data in stats.items() if isinstance(data, dict))
+            self._ranking = (self.revision, count, heapq.nlargest(count, players, key=lambda x: x[1]))
+        return self._ranking[2]
     
 
 class Renderer:
@@ -301,12 +521,23 @@ class Renderer:
         theme_manager (ThemeManager): Manages the game's themes and associated colors.
         fonts (Fonts): Manages the fonts used throughout the game.
         game (TicTacToeGame): The main game object, used for accessing game state.
-        state (GameState): The current game state.
 
     Methods:
         render():
             Renders the current game screen based on the game state.
 
+        compute_layout(width, height):
+            Computes the screen positions and button rects for a window size.
+
+        mark_dirty(rect):
+            Marks a screen region as changed.
+
+        present():
+            Pushes the changed screen regions to the display.
+
+        clear_text_cache():
+            Drops cached text surfaces, e.g. after a theme change.
+
         draw_text(text, font, color, center):
             Renders a single line of text at a specific position.
 
@@ -336,34 +567,322 @@ class Renderer:
     """
 
 
-    def __init__(self, game, screen, theme_manager, fonts, state=GameState.MENU):
+    def __init__(self, game, screen, theme_manager, fonts):
         """Initializes the Renderer with game, screen, theme, and font information."""
 
         self.screen = screen
         self.theme_manager = theme_manager 
         self.fonts = fonts
         self.game = game
-        self.state = self.game.state
+        self._theme = None  # Active theme, fetched once per frame in render()
+        self._preloaded_theme = None  # Theme whose labels were last handed to Fonts.preload()
+        self._layout = None  # Game layout the cached surfaces were built for, see compute_layout()
+        self._layout_key = None  # (width, height) the layout was computed for
+        self._grid_surface = None  # Pre-rendered board grid
+        self._grid_key = None  # (layout key, background, grid color) the grid surface was built for
+        self._glyphs = None  # Symbol -> (glyph surface, centered rect for each tile)
+        self._glyphs_key = None  # (layout key, x color, o color) the glyphs were built for
+        self._leaderboard_cache = None  # (surface, rect relative to the leaderboard origin) rows
+        self._leaderboard_key = None  # (stats revision, font color) the rows were rendered for
+        self._leaderboard_rows = {}  # (rank, name, wins, font color) -> rendered row surface
+        self._dirty = []  # Screen regions changed since the last present()
+        self._last_screen = None  # (state, game mode, theme name) drawn in the previous frame
+        self._needs_full_redraw = True  # Static screens are only redrawn after a screen or theme change
+        self._shown_error = None  # Error message drawn in the previous frame
+        self._input_areas = {}  # Input box name -> area its box and typed text covered in the last frame
+        self._last_inputs = None  # (active input, typed texts) drawn in the previous frame
+        self._input_text_surfaces = {}  # Input box name -> (typed text, color, rendered surface)
+        self._gameover_msg_surface = None  # Game result message, rendered once on entering GAME_OVER
+        self._drawn_board = None  # (board, ai_turn) shown by the last GAME frame
+
+        # Screen renderer for each game state
+        self._dispatch = {
+            GameState.MENU: self.render_menu,
+            GameState.PLAYER_SELECTION: self.render_player_selection,
+            GameState.GAME: self.render_game,
+            GameState.GAME_OVER: self.render_game_over,
+            GameState.SCORES: self.render_scores,
+            GameState.SETTINGS: self.render_settings,
+        }
 
 
     def render(self):
         """Renders the appropriate game screen based on the current game state."""
 
-        theme = self.theme_manager.get_theme()
+        self._theme = self.theme_manager.get_theme()
+        theme = self._theme
+        if self.game.layout is not self._layout:
+            self._layout = self.game.layout
+            self._layout_key = (self.game.width, self.game.height)
+            self._needs_full_redraw = True
+        if theme is not self._preloaded_theme:
+            self._preload_theme_labels(theme)
+            self._preloaded_theme = theme
+
+        # The result can't change until the game is left, so render its message on entering GAME_OVER
+        if self.game.state == GameState.GAME_OVER:
+            if self._last_screen is None or self._last_screen[0] != GameState.GAME_OVER:
+                message = self.game.event_handler.handle_game_result()
+                self._gameover_msg_surface = self._get_text(message, self.fonts.largeFont, theme["font_color"])
+        else:
+            self._gameover_msg_surface = None
+
+        # Screens only need redrawing and presenting when they change: the board after a move or a turn change,
+        # and name entry is redrawn every frame but only presents its changed input boxes
+        screen_key = (self.game.state, self.game.game_mode, self.theme_manager.current_theme)
+        if screen_key != self._last_screen:
+            self._needs_full_redraw = True
+            self._last_screen = screen_key
+        notifications = self.game.notifications
+        if notifications:
+            now = pygame.time.get_ticks()
+            notifications[:] = [n for n in notifications if n.expires_ms > now]  # Drop expired messages
+        error = notifications[-1].text if notifications else None  # The newest message is drawn on top
+        if error != self._shown_error:
+            self._needs_full_redraw = True  # Show or clear the error message
+            self._shown_error = error
+        full_redraw = self._needs_full_redraw
+        name_entry = self.game.state == GameState.PLAYER_SELECTION and self.game.game_mode == "2P"
+        changed = None
+        if self.game.state == GameState.GAME:
+            changed = self._board_changes(full_redraw)
+        if not (full_redraw or name_entry or changed):
+            return  # The screen surface still holds the last frame
+
         self.screen.fill(theme["background"])  # Use theme background color
+        render_screen = self._dispatch.get(self.game.state)
+        if render_screen is not None:
+            render_screen()
+        if error is not None:
+            self.draw_text(error, self.fonts.mediumFont, Colors.RED, (self.game.width // 2, self.game.height // 2 + 60))
+        if full_redraw:
+            self.mark_dirty()
+        elif changed:
+            for rect in changed:
+                self.mark_dirty(rect)
+        self._needs_full_redraw = False
+
+
+    def _board_changes(self, full_redraw):
+        """Returns the screen regions a GAME frame has to present, and remembers the board they show.
 
-        if self.game.state == GameState.MENU:
-            self.render_menu()
-        elif self.game.state == GameState.PLAYER_SELECTION:
-            self.render_player_selection()
-        elif self.game.state == GameState.GAME:
-            self.render_game()
-        elif self.game.state == GameState.GAME_OVER:
-            self.render_game_over()
-        elif self.game.state == GameState.SCORES:
-            self.render_scores()
-        elif self.game.state == GameState.SETTINGS:
-            self.render_settings()
+        Moves always produce a new board list, so comparing identities is enough to detect one; only the tiles
+        whose cell differs are presented, plus the status line above the board.
+
+        Args:
+            full_redraw (bool): Whether the whole screen is redrawn this frame anyway.
+
+        Returns:
+            list: The changed rects, empty if the frame shows nothing new.
+        """
+
+        board = self.game.board
+        shown = (board, self.game.ai_turn)
+        drawn = self._drawn_board
+        self._drawn_board = shown
+        if full_redraw or drawn is None:
+            return []
+        if drawn[0] is board and drawn[1] == shown[1]:
+            return []
+
+        tiles = self._layout["tile_rects"]
+        old_cells = [cell for row in drawn[0] for cell in row]
+        new_cells = [cell for row in board for cell in row]
+        changed = [tiles[idx] for idx in range(9) if old_cells[idx] != new_cells[idx]]
+        changed.append(self._layout["status_rect"])
+        return changed
+
+
+    def compute_layout(self, width, height):
+        """Computes the positions of every screen element for a window size.
+
+        Buttons are stored as rects by name under "buttons"; the per-screen lists pair those rects with their labels.
+        The game keeps the result as its layout, so drawing and click checks always use the same rects.
+
+        Args:
+            width (int): The width of the game window.
+            height (int): The height of the game window.
+
+        Returns:
+            dict: The screen positions and board geometry.
+        """
+
+        tile_size = width // 6
+        tile_origin = (width // 2 - (1.5 * tile_size),
+                       height // 2 - (1.5 * tile_size))
+        tile_rects = [
+            pygame.Rect(tile_origin[0] + j * tile_size, tile_origin[1] + i * tile_size, tile_size, tile_size)
+            for i in range(3) for j in range(3)
+        ]
+
+        def button(center_x, top):
+            return pygame.Rect(center_x - 100, top, 200, 50)
+
+        buttons = {
+            # Main menu
+            "vs_ai": button(2 * width // 4, height // 3),
+            "vs_player": button(2 * width // 4, height // 2),
+            "settings": button(2 * width // 4, height // 1.5),
+            # Side selection (vs AI)
+            "play_x": button(2 * width // 4, height // 3),
+            "play_o": button(2 * width // 4, height // 2),
+            "side_back": button(2 * width // 4, height // 1.5),
+            # Name entry (2P)
+            "start": button(width // 5.2, height * 3 // 4),
+            "scores": button(width // 2, height * 3 // 4),
+            "names_back": button(width // 1.25, height * 3 // 4),
+            # Settings and scores
+            "back": button(width // 2, height * 3 // 4),
+            "apply": button(width // 2, height * 6 // 4),
+            # Game over
+            "play_again": button(width // 3, height - 65),
+            "main_menu": button(2 * width // 3, height - 65),
+        }
+
+        return {
+            "tile_size": tile_size,
+            "tile_origin": tile_origin,
+            "tile_rects": tile_rects,  # Flat row-major list of the 9 board tiles
+            "title_center": (width // 2, 50),
+            "status_center": (width // 2, 30),
+            "status_rect": pygame.Rect(0, 0, width, tile_rects[0].top),  # Band above the board holding the status line
+            "buttons": buttons,
+            "menu_buttons": (
+                ("vs AI", buttons["vs_ai"]),
+                ("2 Players", buttons["vs_player"]),
+                ("Settings", buttons["settings"]),
+            ),
+            "side_buttons": (
+                ("Play as X", buttons["play_x"]),
+                ("Play as O", buttons["play_o"]),
+                ("Back", buttons["side_back"]),
+            ),
+            "name_buttons": (
+                ("Start Game", buttons["start"]),
+                ("Scores", buttons["scores"]),
+                ("Back", buttons["names_back"]),
+            ),
+            "theme_buttons": {
+                theme_name: button(width // 2, 150 + 70 * i)
+                for i, theme_name in enumerate(self.theme_manager.theme_names())
+            },
+            "game_over_buttons": (
+                ("Play Again", buttons["play_again"]),
+                ("Main Menu", buttons["main_menu"]),
+            ),
+            "leaderboard_origin": (width // 2, height // 2),
+            "scores_heading_center": (width // 2, 100),
+            "scores_leaderboard_origin": (width // 2, 150),
+        }
+
+
+    def _get_text(self, text, font, color):
+        """Returns a rendered text surface, rendering it only the first time it is requested.
+
+        Args:
+            text (str): The text to render.
+            font (pygame.font.Font): The font object for rendering.
+            color (tuple): The RGB color of the text.
+
+        Returns:
+            pygame.Surface: The cached surface for the text.
+        """
+
+        return self.fonts.render_cached(text, font, color)
+
+
+    def _preload_theme_labels(self, theme):
+        """Renders every fixed label of every screen in the theme's colors.
+
+        Args:
+            theme (dict): The active theme.
+        """
+
+        layout = self._layout
+        fonts = self.fonts
+        button_labels = [text for group in ("menu_buttons", "side_buttons", "name_buttons", "game_over_buttons")
+                         for text, _ in layout[group]]
+        button_labels.extend(layout["theme_buttons"])
+        fonts.preload(fonts.mediumFont, theme["button_text_color"], button_labels)
+        fonts.preload(fonts.mediumFont, theme["font_color"], self.game.input_labels.values())
+        fonts.preload(fonts.largeFont, theme["font_color"], (
+            "Play Tic-Tac-Toe", "Settings", "Choose Your Side", "Enter Player Names", "Top Rankings",
+            "Your Turn", "Computer Thinking...",
+        ))
+
+
+    def mark_dirty(self, rect=None):
+        """Marks a screen region as changed so the next present() pushes it to the display.
+
+        Marking the whole screen also makes the next render() redraw it, e.g. after something was drawn over it
+        outside the renderer.
+
+        Args:
+            rect (pygame.Rect): The changed region. Defaults to the whole screen.
+        """
+
+        if rect is None:
+            self._needs_full_redraw = True
+            self._dirty[:] = [self.screen.get_rect()]  # Covers every region marked so far
+            return
+        self._dirty.append(rect)
+
+
+    def present(self):
+        """Pushes the regions changed since the last call to the display.
+
+        Static screens present nothing. Falls back to a full flip when the changed regions cover more than
+        half of the screen.
+        """
+
+        if not self._dirty:
+            return
+
+        screen_area = self.screen.get_width() * self.screen.get_height()
+        if sum(rect.w * rect.h for rect in self._dirty) > screen_area // 2:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._dirty)
+        self._dirty.clear()
+
+
+    def clear_text_cache(self):
+        """Drops all cached text surfaces, e.g. after a theme change made their colors obsolete."""
+
+        self.fonts.clear_static()
+        self._preloaded_theme = None
+
+
+    def _blit_batch(self, sequence):
+        """Blits a sequence of (surface, destination) pairs to the screen in a single call.
+
+        Uses `Surface.fblits` where available (pygame-ce) and falls back to `Surface.blits`.
+
+        Args:
+            sequence (list): The (surface, destination) pairs to blit.
+        """
+
+        fblits = getattr(self.screen, "fblits", None)
+        if fblits is not None:
+            fblits(sequence)
+        else:
+            self.screen.blits(sequence, doreturn=False)
+
+
+    def _blit_if_visible(self, surface, dest):
+        """Blits a surface only if its destination rect intersects the screen's clip area.
+
+        Args:
+            surface (pygame.Surface): The surface to blit.
+            dest (pygame.Rect): The destination rect on the screen.
+
+        Returns:
+            pygame.Rect: The area that was drawn, or None if the surface was off-screen.
+        """
+
+        if dest.colliderect(self.screen.get_clip()):
+            return self.screen.blit(surface, dest)
+        return None
 
 
     def draw_text(self, text, font, color, center):
@@ -376,7 +895,7 @@ class Renderer:
             center (tuple): The center position of the text.
         """
 
-        rendered_text = font.render(text, True, color)
+        rendered_text = self._get_text(text, font, color)
         rect = rendered_text.get_rect()
         rect.center = center
         self.screen.blit(rendered_text, rect)
@@ -387,7 +906,8 @@ class Renderer:
 
         Args:
             text (str): The text to display on the button.
-            pos (tuple): The position of the button's center.
+            pos (tuple or pygame.Rect): The position of the button's top center, or a precomputed button rect
+                from the game layout, in which case size is ignored.
             size (tuple): The size (width, height) of the button.
             border_radius (int): The radius for rounding button corners.
 
@@ -395,14 +915,17 @@ class Renderer:
             pygame.Rect: The rectangle of the button for collision detection.
         """
 
-        theme = self.theme_manager.get_theme()
+        theme = self._theme
         button_color = theme["button_color"]
         text_color = theme["button_text_color"]
 
-        button = pygame.Rect(pos[0] - size[0] // 2, pos[1], size[0], size[1])
+        if isinstance(pos, pygame.Rect):
+            button = pos
+        else:
+            button = pygame.Rect(pos[0] - size[0] // 2, pos[1], size[0], size[1])
         pygame.draw.rect(self.screen, button_color, button, border_radius=border_radius)
 
-        text_surface = self.fonts.mediumFont.render(text, True, text_color)
+        text_surface = self._get_text(text, self.fonts.mediumFont, text_color)
         text_rect = text_surface.get_rect(center=button.center)
         self.screen.blit(text_surface, text_rect)
 
@@ -412,223 +935,279 @@ class Renderer:
     def render_menu(self):
         """Renders the main menu screen with title and navigation buttons."""
 
-        theme = self.theme_manager.get_theme()
+        theme = self._theme
+        layout = self._layout
         # Draw title
-        title = self.fonts.largeFont.render("Play Tic-Tac-Toe", True, theme["font_color"])
+        title = self._get_text("Play Tic-Tac-Toe", self.fonts.largeFont, theme["font_color"])
         title_rect = title.get_rect()
-        title_rect.center = (self.game.width // 2, 50)
+        title_rect.center = layout["title_center"]
         self.screen.blit(title, title_rect)
 
         # Draw buttons
-        self.draw_button("vs AI", (2*self.game.width // 4, self.game.height // 3))
-        self.draw_button("2 Players", (2*self.game.width // 4, self.game.height // 2))
-        self.draw_button("Settings", (2*self.game.width // 4, self.game.height // 1.5))
+        for text, rect in layout["menu_buttons"]:
+            self.draw_button(text, rect)
 
 
     def render_settings(self):
         """Renders the settings screen for selecting themes."""
 
         # Use the theme dictionary loaded from JSON
-        theme = self.theme_manager.get_theme()
-        self.screen.fill(theme["background"])  # Set background color
+        theme = self._theme
+        layout = self._layout
 
         # Heading
-        heading = self.fonts.largeFont.render("Settings", True, theme["font_color"])
-        heading_rect = heading.get_rect(center=(self.game.width // 2, 50))
+        heading = self._get_text("Settings", self.fonts.largeFont, theme["font_color"])
+        heading_rect = heading.get_rect(center=layout["title_center"])
         self.screen.blit(heading, heading_rect)
 
-        # Theme buttons
-        y_offset = 150
-        for theme_name in self.theme_manager.themes.keys():
-            # Draw button for each theme
-            button = self.draw_button(
-                theme_name,
-                (self.game.width // 2, y_offset),
-                size=(200, 50)
-            )
-
-            # Check if the button is clicked
-            if button.collidepoint(pygame.mouse.get_pos()) and pygame.mouse.get_pressed()[0]:
-                self.theme_manager.current_theme = theme_name  # Update current theme
-                self.theme_manager.save_theme()  # Save the selected theme to the JSON file
-
-            y_offset += 70
+        # Theme buttons, clicks on them are handled by EventHandler._on_theme
+        for theme_name, rect in layout["theme_buttons"].items():
+            self.draw_button(theme_name, rect)
 
         # Back button
-        self.draw_button("Back", (self.game.width // 2, self.game.height * 3 // 4))
+        self.draw_button("Back", layout["buttons"]["back"])
 
 
     def render_player_selection(self):
         """Renders the player selection screen for choosing sides or entering names."""
 
-        theme = self.theme_manager.get_theme()
+        theme = self._theme
+        layout = self._layout
 
         if self.game.game_mode == "AI":
-            #print("DEBUG: Rendering AI player selection screen")
-            #print(f"DEBUG: Game state: {self.game.state}")
-            title = self.fonts.largeFont.render("Choose Your Side", True, theme["font_color"])
-            title_rect = title.get_rect(center=(self.game.width // 2, 50))
+            title = self._get_text("Choose Your Side", self.fonts.largeFont, theme["font_color"])
+            title_rect = title.get_rect(center=layout["title_center"])
             self.screen.blit(title, title_rect)
 
-            self.draw_button("Play as X", (2* self.game.width // 4, self.game.height // 3))
-            self.draw_button("Play as O", (2* self.game.width // 4, self.game.height // 2))
-            self.draw_button("Back", (2* self.game.width // 4, self.game.height // 1.5))
+            for text, rect in layout["side_buttons"]:
+                self.draw_button(text, rect)
 
         else: # 2P
-            print("Render_player_selection 2P - Enter Player Names")
-            title = self.fonts.largeFont.render("Enter Player Names", True, theme["font_color"])
-            title_rect = title.get_rect(center=(self.game.width // 2, 50))
+            logger.debug("Render_player_selection 2P - Enter Player Names")
+            title = self._get_text("Enter Player Names", self.fonts.largeFont, theme["font_color"])
+            title_rect = title.get_rect(center=layout["title_center"])
             self.screen.blit(title, title_rect)
 
+            # Present the input boxes again when the typed text or the active box changed
+            inputs = (self.game.active_input, tuple(self.game.input_texts.items()))
+            inputs_changed = inputs != self._last_inputs
+            self._last_inputs = inputs
+
             # Draw input boxes and labels
             for box_name, box in self.game.input_boxes.items():
                 color = Colors.WHITE if box_name == self.game.active_input else Colors.GREY
                 pygame.draw.rect(self.screen, color, box, 2)
 
                 # Draw label
-                label = self.fonts.mediumFont.render(self.game.input_labels[box_name], True, theme["font_color"])
+                label = self._get_text(self.game.input_labels[box_name], self.fonts.mediumFont, theme["font_color"])
                 label_rect = label.get_rect(bottomleft=(box.left, box.top - 5))
-                self.screen.blit(label, label_rect)
+                self._blit_if_visible(label, label_rect)
 
                 # Draw input text
-                text_surface = self.fonts.mediumFont.render(self.game.input_texts[box_name], True, theme["font_color"])
-                self.screen.blit(text_surface, (box.x + 5, box.y + 5))
-
-            self.draw_button("Start Game", (self.game.width // 5.2, self.game.height * 3 // 4))
-            # Draw scores button to see the top rankings
-            self.draw_button("Scores", (self.game.width // 2, self.game.height * 3 // 4))
-
-            self.draw_button("Back", (self.game.width // 1.25, self.game.height * 3 // 4))
+                # Typed text changes on every keystroke, so keep only the latest surface per box instead of
+                # filling the shared text cache
+                typed = self.game.input_texts[box_name]
+                cached = self._input_text_surfaces.get(box_name)
+                if cached is None or cached[0] != typed or cached[1] != theme["font_color"]:
+                    surface = self.fonts.mediumFont.render(typed, True, theme["font_color"]).convert_alpha()
+                    cached = (typed, theme["font_color"], surface)
+                    self._input_text_surfaces[box_name] = cached
+                text_surface = cached[2]
+                text_rect = text_surface.get_rect(topleft=(box.x + 5, box.y + 5))
+                self._blit_if_visible(text_surface, text_rect)
+
+                if inputs_changed:
+                    area = box.union(text_rect)
+                    previous_area = self._input_areas.get(box_name)
+                    self.mark_dirty(area if previous_area is None else area.union(previous_area))
+                    self._input_areas[box_name] = area
+
+            # Start Game, Scores (to see the top rankings) and Back buttons
+            for text, rect in layout["name_buttons"]:
+                self.draw_button(text, rect)
 
 
     def render_game(self):
         """Renders the game board, player moves, and status messages."""
 
-        theme = self.theme_manager.get_theme()  # Load the current theme colors
+        theme = self._theme  # Current theme colors, cached in render()
+        is_terminal = self.game.terminal()
+        current_player = None if is_terminal else self.game.current_player()
         grid_color = theme["grid_color"]
         x_color = theme["x_color"]
         o_color = theme["o_color"]
 
         # Draw game board
-        tile_size = self.game.width // 6
-        tile_origin = (self.game.width // 2 - (1.5 * tile_size),
-                       self.game.height // 2 - (1.5 * tile_size))
-        tiles = []
-        for i in range(3):
-            row = []
-            for j in range(3):
-                rect = pygame.Rect(
-                    tile_origin[0] + j * tile_size,
-                    tile_origin[1] + i * tile_size,
-                    tile_size, tile_size
-                )
-                pygame.draw.rect(self.screen, grid_color, rect, 3)
-
-                if self.game.board[i][j] != ttt.EMPTY:
-                    move_color = x_color if self.game.board[i][j] == "X" else o_color
-                    move = self.fonts.moveFont.render(self.game.board[i][j], True, move_color)  # Use x_color or o_color
-                    move_rect = move.get_rect()
-                    move_rect.center = rect.center
-                    self.screen.blit(move, move_rect)
-                row.append(rect)
-            tiles.append(row)
-
-        # Draw game status
-        if ttt.terminal(self.game.board):
-            self.game.state = GameState.GAME_OVER
-        else:
-            player = ttt.player(self.game.board)
-            player_name = self.game.current_players[ttt.player(self.game.board)]
+        key = (self._layout_key, theme["background"], grid_color)
+        if self._grid_key != key:
+            self._build_grid(theme["background"], grid_color)
+            self._grid_key = key
+        self.screen.blit(self._grid_surface, (0, 0))
+
+        # X and O glyphs and their position in every tile only change with the layout or theme
+        key = (self._layout_key, x_color, o_color)
+        if self._glyphs_key != key:
+            self._glyphs = {}
+            for symbol, color in ((ttt.X, x_color), (ttt.O, o_color)):
+                glyph = self._get_text(symbol, self.fonts.moveFont, color)
+                self._glyphs[symbol] = (glyph, [glyph.get_rect(center=rect.center)
+                                                for rect in self._layout["tile_rects"]])
+            self._glyphs_key = key
+
+        # Hoist lookups out of the tile loop
+        board = self.game.board
+        empty = ttt.EMPTY
+        glyphs = self._glyphs
+
+        moves = []  # (glyph, rect) pairs, blitted together in one call
+        add_move = moves.append
+        cells = (cell for row in board for cell in row)  # Row-major, matching tile_rects
+        for idx, cell in enumerate(cells):
+            if cell is not empty:
+                glyph, rects = glyphs[cell]
+                add_move((glyph, rects[idx]))
+        self._blit_batch(moves)
+
+        # Draw game status; a finished game is moved on to GAME_OVER by TicTacToeGame.update_game_over()
+        if not is_terminal:
+            player_name = self.game.current_players[current_player]
             if self.game.game_mode == "2P":
                 status = f"Player {player_name}'s Turn"
             else:
                 if self.game.ai_turn:
-                    print("DEBUG: AI Turn")
+                    logger.debug("AI Turn")
                     status = f"Computer Thinking..."
                 else:
                     status = f"Your Turn"
 
-            status_text = self.fonts.largeFont.render(status, True, theme["font_color"])
+            status_text = self._get_text(status, self.fonts.largeFont, theme["font_color"])
             status_rect = status_text.get_rect()
-            status_rect.center = (self.game.width // 2, 30)
+            status_rect.center = self._layout["status_center"]
             self.screen.blit(status_text, status_rect)
-            time.sleep(0.2)
 
-        if self.game.state == GameState.GAME:
-            if self.game.game_mode == "AI" and not self.game.user == ttt.player(self.game.board):
-                if self.game.ai_turn:
-                    time.sleep(0.2)
-                    move = ttt.minimax(self.game.board)
-                    self.game.board = ttt.result(self.game.board, move)
-                    self.game.ai_turn = False
-                else:
-                    time.sleep(0.2)
-                    self.game.ai_turn = True
+
+    def _build_grid(self, background, grid_color):
+        """Draws the board grid once into an opaque off-screen surface.
+
+        The surface covers the whole screen including the background, so it can be blitted without
+        per-pixel alpha blending.
+
+        Args:
+            background (tuple): The RGB color of the screen background.
+            grid_color (tuple): The RGB color of the grid lines.
+        """
+
+        self._grid_surface = pygame.Surface(self._layout_key).convert()
+        self._grid_surface.fill(background)
+
+        # Outer border plus two inner lines per direction. Inner lines are 6px wide, matching the two
+        # 3px tile outlines that used to meet there.
+        tiles = self._layout["tile_rects"]
+        board_rect = tiles[0].union(tiles[8])
+        pygame.draw.rect(self._grid_surface, grid_color, board_rect, 3)
+        for k in (1, 2):
+            x = tiles[k].left
+            y = tiles[3 * k].top
+            self._grid_surface.fill(grid_color, (x - 3, board_rect.top, 6, board_rect.height))
+            self._grid_surface.fill(grid_color, (board_rect.left, y - 3, board_rect.width, 6))
 
 
     def render_game_over(self):
         """Renders the game over screen with results and leaderboard."""
 
-        theme = self.theme_manager.get_theme()
+        layout = self._layout
         self.render_game()  # Show final board state
-        message = self.game.event_handler.handle_game_result()
-        message_text = self.fonts.largeFont.render(message, True, theme["font_color"])
+        message_text = self._gameover_msg_surface
         message_rect = message_text.get_rect()
-        message_rect.center = (self.game.width / 2, 30)
+        message_rect.center = layout["status_center"]
         self.screen.blit(message_text, message_rect)
 
         # Draw leaderboard
-        self.render_leaderboard(self.game.width // 2, self.game.height // 2)
+        self.render_leaderboard(*layout["leaderboard_origin"])
 
         # Draw buttons
-        self.draw_button("Play Again", (self.game.width // 3, self.game.height - 65))
-        self.draw_button("Main Menu", (2 * self.game.width // 3, self.game.height - 65))
+        for text, rect in layout["game_over_buttons"]:
+            self.draw_button(text, rect)
 
 
     def render_leaderboard(self, x, y):
         """Renders the leaderboard showing the top player rankings."""
 
-        theme = self.theme_manager.get_theme()
+        theme = self._theme
         if not self.game.show_leaderboard:
             return
 
-        stats = self.game.storage_manager.load_stats()
+        # Only re-render the rows when the stats or the font color changed
+        storage_manager = self.game.storage_manager
+        storage_manager.load_stats()  # One stat() call; bumps the revision if the file was changed externally
+        if self._leaderboard_key != (storage_manager.revision, theme["font_color"]):
+            self._leaderboard_cache = self._build_leaderboard(theme["font_color"])
+            # Loading the stats may itself bump the revision, so read it after building
+            self._leaderboard_key = (storage_manager.revision, theme["font_color"])
+
+        # Rows are ordered top to bottom, so stop at the first one below the visible area
+        clip = self.screen.get_clip()
+        clip_bottom = clip.bottom
+        visible = clip.colliderect
+        rows = []
+        add_row = rows.append
+        for surface, rect in self._leaderboard_cache:
+            dest = rect.move(x, y)
+            if dest.top >= clip_bottom:
+                break
+            if visible(dest):
+                add_row((surface, dest))
+        self._blit_batch(rows)
+
+
+    def _build_leaderboard(self, font_color):
+        """Loads the player stats and renders the top 10 leaderboard rows.
+
+        Row surfaces are kept by (rank, name, wins, font color), so after a game only the rows that changed
+        are rendered again.
 
-        # Sort players by score (wins * 3 + ties)
-        players = []
-        for name, data in stats.items():
-            if not isinstance(data, dict):
-                continue  # Skip invalid entries
-            wins = int(data.get("wins", 0))  # Default to 0 if key is missing
-            #ties = int(data.get("ties", 0))  # Default to 0 if key is missing
-            #losses = int(data.get("losses", 0))  # Default to 0 if key is missing
-            #score = wins
-            players.append((name, wins))
-        players.sort(key=lambda x: x[1], reverse=True)
+        Args:
+            font_color (tuple): The RGB color of the leaderboard text.
 
-        # Draw top 10 players
-        for i, (name, wins) in enumerate(players[:10]):
-            ranking_text = f"{i + 1}. {name}: {wins} Wins"
-            player_text = self.fonts.mediumFont.render(ranking_text, True, theme["font_color"])
-            text_rect = player_text.get_rect(center=(x, y + i * 30))
-            self.screen.blit(player_text, text_rect)
+        Returns:
+            list: (surface, rect) pairs, one per ranked player, with rects centered on the leaderboard origin.
+        """
+
+        # Players ranked by wins
+        top_players = self.game.storage_manager.top_players(10)
+
+        # Render top 10 players, reusing the surfaces of unchanged rows
+        previous = self._leaderboard_rows
+        row_surfaces = {}
+        rows = []
+        for i, (name, wins) in enumerate(top_players):
+            key = (i, name, wins, font_color)
+            player_text = previous.get(key)
+            if player_text is None:
+                ranking_text = f"{i + 1}. {name}: {wins} Wins"
+                player_text = self.fonts.mediumFont.render(ranking_text, True, font_color).convert_alpha()
+            row_surfaces[key] = player_text
+            rows.append((player_text, player_text.get_rect(center=(0, i * 30))))
+        self._leaderboard_rows = row_surfaces  # Only keep the rows that are shown
+        return rows
 
 
     def render_scores(self):
         """Renders the scores screen, including the leaderboard."""
 
-        theme = self.theme_manager.get_theme()
+        theme = self._theme
+        layout = self._layout
         # Draw heading
-        heading = self.fonts.largeFont.render("Top Rankings", True, theme["font_color"])
-        heading_rect = heading.get_rect(center=(self.screen.get_width() // 2, 100))
+        heading = self._get_text("Top Rankings", self.fonts.largeFont, theme["font_color"])
+        heading_rect = heading.get_rect(center=layout["scores_heading_center"])
         self.screen.blit(heading, heading_rect)
 
         # Render leaderboard
         self.game.show_leaderboard = True
-        self.render_leaderboard(self.game.width // 2, 150)
+        self.render_leaderboard(*layout["scores_leaderboard_origin"])
 
         # Draw a back button
-        self.draw_button("Back", (self.game.width // 2, self.game.height * 3 // 4))
+        self.draw_button("Back", layout["buttons"]["back"])
 
 
 class EventHandler:
@@ -637,249 +1216,274 @@ class EventHandler:
     Attributes:
         game (Game): The main game object containing game state and logic.
         fonts (Fonts): The font manager for rendering text.
-        state (GameState): The current game state.
 
     Methods:
-        handle_events():
+        handle_events(events):
             Processes all user events, including mouse and keyboard input.
 
         handle_click(mouse_pos):
-            Handles mouse click events based on the current game state.
-
-        handle_settings_click(mouse_pos):
-            Handles clicks in the settings state.
-
-        handle_scores_click(mouse_pos):
-            Handles clicks in the scores state.
-
-        handle_menu_click(mouse_pos):
-            Handles clicks in the menu state.
-
-        handle_player_selection_click(mouse_pos):
-            Handles clicks in the player selection state.
+            Handles mouse click events based on the current game state, dispatching button clicks through a
+            per-screen (rect, callback) table.
 
         handle_game_click(mouse_pos):
             Handles mouse clicks during gameplay.
 
-        handle_game_over_click(mouse_pos):
-            Handles clicks in the game over state.
+        show_error(message, duration_ms):
+            Shows an error message for a while without blocking the main loop.
 
         handle_game_result():
             Determines the result of the game and updates player stats if necessary.
     """
 
-    def __init__(self, game, fonts, state):
+    def __init__(self, game, fonts):
         """Initializes the EventHandler.
 
         Args:
             game (Game): The main game object containing game state and logic.
             fonts (Fonts): The font manager for rendering text.
-            state (GameState): The current game state.
         """
 
         self.game = game
         self.fonts = fonts
-        self.state = self.game.state
+        self._actions = {}  # Screen -> (rect, callback) pairs, see _button_actions()
+        self._actions_layout = None  # Game layout the action table was built from
+        self._last_click_ms = 0  # pygame.time.get_ticks() of the last accepted click
+        self._result_message = None  # Result of the finished game, see handle_game_result()
         
 
-    def handle_events(self):
+    def handle_events(self, events=None):
         """Processes all user events, including mouse and keyboard input.
 
-        Handles quitting the game, mouse clicks, and keyboard input for player name entry during player selection.
+        Handles quitting the game, mouse clicks, keyboard input for player name entry during player selection, and
+        window exposure, which makes the renderer repaint the whole screen. The queue is drained with a single pygame.event.get() call, which pumps SDL events once per frame. Event
+        types that are not handled here are blocked in TicTacToeGame.__init__(), so they never reach the queue.
+
+        Args:
+            events (list): The events to process, in order. Defaults to draining the event queue.
         """
 
-        for event in pygame.event.get():
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
+                self.game.storage_manager.flush()
                 pygame.quit()
                 sys.exit()
 
+            elif event.type in REDRAW_EVENTS:
+                # Static screens skip unchanged frames, so repaint the whole window once it is visible again
+                self.game.renderer.mark_dirty()
+
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = event.pos  # Where the click happened, without querying SDL again
                 self.handle_click(mouse_pos)
 
-                # Handle input box selection
+                # Handle input box selection, stopping at the first box hit (clicking elsewhere clears the focus)
                 if self.game.state == GameState.PLAYER_SELECTION and self.game.game_mode == "2P":
-                    self.game.active_input = None
-                    for box_name, box in self.game.input_boxes.items():
-                        if box.collidepoint(mouse_pos):
-                            self.game.active_input = box_name
+                    self.game.active_input = next(
+                        (box_name for box_name, box in self.game.input_boxes.items() if box.collidepoint(mouse_pos)),
+                        None,
+                    )
 
             elif event.type == pygame.KEYDOWN and self.game.active_input:
+                input_texts = self.game.input_texts
                 if event.key == pygame.K_RETURN:
-                    if self.game.input_texts["player1"] and self.game.input_texts["player2"]:
-                        self.game.current_players["X"] = self.game.input_texts["player1"]
-                        self.game.current_players["O"] = self.game.input_texts["player2"]
+                    if input_texts["player1"] and input_texts["player2"]:
+                        self.game.current_players["X"] = input_texts["player1"]
+                        self.game.current_players["O"] = input_texts["player2"]
                         self.game.state = GameState.GAME
-                elif event.key == pygame.K_BACKSPACE:
-                    self.game.input_texts[self.game.active_input] = self.game.input_texts[self.game.active_input][:-1]
-                else:
-                    if len(self.game.input_texts[self.game.active_input]) < 15:  # Limit name length
-                        self.game.input_texts[self.game.active_input] += event.unicode
+                    continue
+
+                # Edit the active box's text in a local and store it back once
+                box_name = self.game.active_input
+                text = input_texts[box_name]
+                if event.key == pygame.K_BACKSPACE:
+                    text = text[:-1]
+                elif len(text) < 15:  # Limit name length
+                    text += event.unicode
+                input_texts[box_name] = text
 
 
     def handle_click(self, mouse_pos):
         """Handles mouse click events based on the current game state.
 
+        Buttons are looked up in the (rect, callback) table of the current screen, see _button_actions(). Clicks
+        within 200 ms of the previous one are ignored to prevent double clicks.
+
         Args:
             mouse_pos (tuple): The position of the mouse click.
         """
 
-        if self.game.state == GameState.MENU:
-            self.handle_menu_click(mouse_pos)
-        elif self.game.state == GameState.PLAYER_SELECTION:
-            self.handle_player_selection_click(mouse_pos)
-        elif self.game.state == GameState.GAME:
+        now = pygame.time.get_ticks()
+        if now - self._last_click_ms < 200:
+            return
+        self._last_click_ms = now
+
+        state = self.game.state
+        key = (state, self.game.game_mode) if state == GameState.PLAYER_SELECTION else state
+        for rect, action in self._button_actions().get(key, ()):
+            if rect.collidepoint(mouse_pos):
+                action()
+                return
+
+        if state == GameState.GAME:
             self.handle_game_click(mouse_pos)
-        elif self.game.state == GameState.GAME_OVER:
-            self.handle_game_over_click(mouse_pos)
-        elif self.game.state == GameState.SCORES:
-            self.handle_scores_click(mouse_pos)
-        elif self.game.state == GameState.SETTINGS:
-            self.handle_settings_click(mouse_pos)
 
 
-    def handle_settings_click(self, mouse_pos):
-        """Handles clicks in the settings state.
+    def _button_actions(self):
+        """Returns the (rect, callback) pairs of every screen's buttons.
 
-        Args:
-            mouse_pos (tuple): The position of the mouse click. Checks if buttons (e.g., Apply, Back) are clicked.
+        The table is built from the game layout, so it is only rebuilt when the layout is.
+
+        Returns:
+            dict: Maps a game state, or a (PLAYER_SELECTION, game mode) pair, to its (rect, callback) pairs.
         """
 
-        back_button = pygame.Rect(self.game.width // 2 - 100, self.game.height * 3 // 4, 200, 50)
-        apply_button = pygame.Rect(self.game.width // 2 - 100, self.game.height * 6 // 4, 200, 50)
+        layout = self.game.layout
+        if layout is not self._actions_layout:
+            buttons = layout["buttons"]
+            theme_actions = tuple(
+                (rect, partial(self._on_theme, theme_name)) for theme_name, rect in layout["theme_buttons"].items()
+            )
+            self._actions = {
+                GameState.MENU: (
+                    (buttons["vs_ai"], self._on_vs_ai),
+                    (buttons["vs_player"], self._on_vs_player),
+                    (buttons["settings"], self._on_settings),
+                ),
+                (GameState.PLAYER_SELECTION, "AI"): (
+                    (buttons["side_back"], self._on_back_to_menu),
+                    (buttons["play_x"], partial(self._on_play_as, ttt.X)),
+                    (buttons["play_o"], partial(self._on_play_as, ttt.O)),
+                ),
+                (GameState.PLAYER_SELECTION, "2P"): (
+                    (buttons["names_back"], self._on_back_to_menu),
+                    (buttons["scores"], self._on_scores),
+                    (buttons["start"], self._on_start),
+                ),
+                GameState.SETTINGS: theme_actions + (
+                    (buttons["apply"], self._on_settings_done),
+                    (buttons["back"], self._on_settings_done),
+                ),
+                GameState.SCORES: (
+                    (buttons["back"], self._on_scores_back),
+                ),
+                GameState.GAME_OVER: (
+                    (buttons["play_again"], self._on_play_again),
+                    (buttons["main_menu"], self._on_main_menu),
+                ),
+            }
+            self._actions_layout = layout
+        return self._actions
+
+
+    def _on_vs_ai(self):
+        """Menu: starts a new game against the computer, continuing with side selection."""
+
+        self.game.board = ttt.initial_state()
+        self.game.game_mode = "AI"
+        self.game.show_leaderboard = False
+        self.game.user = None
+        self.game.ai_turn = False
+        self.game.current_players = {"X": None, "O": None}
+        self.game.state = GameState.PLAYER_SELECTION
+
 
-        if apply_button.collidepoint(mouse_pos):
-            self.game.state = GameState.MENU
-            time.sleep(0.2)
-        elif back_button.collidepoint(mouse_pos):
-            self.game.state = GameState.MENU
-            time.sleep(0.2)
+    def _on_vs_player(self):
+        """Menu: starts a new two player game, continuing with name entry."""
 
+        self.game.game_mode = "2P"
+        self.game.show_leaderboard = False
+        self.game.input_texts = {"player1": "", "player2": ""}
+        self.game.state = GameState.PLAYER_SELECTION
 
-    def handle_scores_click(self, mouse_pos):
-        """Handles clicks in the scores state.
+
+    def _on_settings(self):
+        """Menu: opens the settings screen."""
+
+        self.game.state = GameState.SETTINGS
+
+
+    def _on_back_to_menu(self):
+        """Side selection or name entry: goes back to the main menu."""
+
+        self.game.state = GameState.MENU
+
+
+    def _on_play_as(self, symbol):
+        """Side selection: starts the game against the computer with the user playing `symbol`.
 
         Args:
-            mouse_pos (tuple): The position of the mouse click. Checks if the back button is clicked.
+            symbol (str): ttt.X or ttt.O, the side the user plays.
         """
 
-        back_button = pygame.Rect(self.game.width // 2 - 100, self.game.height * 3 // 4, 200, 50)
+        self.game.user = symbol
+        self.game.current_players[symbol] = "Player"
+        self.game.current_players[OPPONENT[symbol]] = "Computer"
+        self.game.state = GameState.GAME
+        self.game.ai_turn = False
+
+
+    def _on_scores(self):
+        """Name entry: opens the top rankings."""
+
+        self.game.state = GameState.SCORES
+
 
-        if back_button.collidepoint(mouse_pos):
-            self.game.state = GameState.PLAYER_SELECTION
-            self.game.show_leaderboard = False
-            time.sleep(0.2)
+    def _on_start(self):
+        """Name entry: starts the two player game, or shows why it can't start yet."""
 
+        if self.game.input_texts["player1"] and self.game.input_texts["player2"]:
 
-    def handle_menu_click(self, mouse_pos):
-        """Handles clicks in the menu state.
+            player1 = self.game.input_texts["player1"]
+            player2 = self.game.input_texts["player2"]
+            if player1 == player2:
+                self.show_error("Player's names are duplicated!!", 1500)
+            else:
+                self.game.current_players["X"] = self.game.input_texts["player1"]
+                self.game.current_players["O"] = self.game.input_texts["player2"]
+                self.game.state = GameState.GAME
+
+        else:
+            # Show an error message if names are not entered
+            self.show_error("Please enter both player names to start", 1000)
+
+
+    def show_error(self, message, duration_ms):
+        """Shows an error message for a while without blocking the main loop.
+
+        The renderer draws it with the next frame and drops it once it has expired.
 
         Args:
-            mouse_pos (tuple): The position of the mouse click. Determines if the player wants to play vs AI,
-            play vs another player, or enter the settings menu.
+            message (str): The message to show.
+            duration_ms (int): How long to show it, in milliseconds.
         """
 
-        vs_ai_button = pygame.Rect(2*self.game.width // 4 - 100, self.game.height // 3, 200, 50)
-        vs_player_button = pygame.Rect(2 * self.game.width // 4 - 100, self.game.height // 2, 200, 50)
-        settings_button = pygame.Rect(2*self.game.width // 4 - 100, self.game.height // 1.5, 200, 50)
-
-        if vs_ai_button.collidepoint(mouse_pos):
-            self.game.board = ttt.initial_state()
-            self.game.game_mode = "AI"
-            self.show_leaderboard = False
-            self.game.user = None
-            self.game.ai_turn = False
-            self.game.current_players = {"X": None, "O": None}
-            self.game.state = GameState.PLAYER_SELECTION
-            time.sleep(0.2)  # Prevent double clicks
-        elif vs_player_button.collidepoint(mouse_pos):
-            self.game.game_mode = "2P"
-            self.show_leaderboard = False
-            self.game.input_texts = {"player1": "", "player2": ""}
-            self.game.state = GameState.PLAYER_SELECTION
-            time.sleep(0.2)
-        elif settings_button.collidepoint(mouse_pos):
-            self.game.state = GameState.SETTINGS
-            time.sleep(0.2)
-
-
-    def handle_player_selection_click(self, mouse_pos):
-        """Handles clicks in the player selection state.
+        self.game.notifications.append(Notification(message, pygame.time.get_ticks() + duration_ms))
+
+
+    def _on_theme(self, theme_name):
+        """Settings: switches to a theme, saving it once per click.
 
         Args:
-            mouse_pos (tuple): The position of the mouse click. Checks for clicks on start buttons, name entry
-            boxes, or scores display.
+            theme_name (str): The name of the clicked theme.
         """
 
-        if ttt.terminal(self.game.board):
-            return
-        current_player = ttt.player(self.game.board)
-
-        play_x_button = pygame.Rect(2* self.game.width // 4 - 100, self.game.height // 3, 200, 50)
-        play_o_button = pygame.Rect(2 * self.game.width // 4 - 100, self.game.height // 2, 200, 50)
-        back_button = pygame.Rect(2* self.game.width // 4 - 100, self.game.height // 1.5, 200, 50)
-        if back_button.collidepoint(mouse_pos):
-            self.game.state = GameState.MENU
-            time.sleep(0.2)
-
-        if self.game.game_mode == "AI" and current_player != self.game.user:
-            if play_x_button.collidepoint(mouse_pos):
-                self.game.user = ttt.X
-                self.game.current_players["X"] = 'Player'
-                self.game.current_players["O"] = 'Computer'
-                self.game.state = GameState.GAME
-                self.game.ai_turn = False
-                time.sleep(0.2)
-            elif play_o_button.collidepoint(mouse_pos):
-                self.game.user = ttt.O
-                self.game.current_players["X"] = "Computer"
-                self.game.current_players["O"] = "Player"
-                self.game.state = GameState.GAME
-                self.game.ai_turn = False
-                time.sleep(0.2)
-
-
-        elif self.game.game_mode == "2P":
-
-            back_button = pygame.Rect(self.game.width // 1.25 - 100, self.game.height * 3 // 4, 200, 50)
-            if back_button.collidepoint(mouse_pos):
-                self.game.state = GameState.MENU
-                time.sleep(0.2)
-
-            # Check if scores button is clicked
-            scores_button = pygame.Rect(self.game.width // 2 - 100, self.game.height * 3 // 4, 200, 50)
-            if scores_button.collidepoint(mouse_pos):
-                self.game.state = GameState.SCORES
-                time.sleep(0.2)
-
-            # Check if start button is clicked
-            start_button = pygame.Rect(self.game.width // 5.2 - 100, self.game.height * 3 // 4, 200, 50)
-            if start_button.collidepoint(mouse_pos):
-                if self.game.input_texts["player1"] and self.game.input_texts["player2"]:
-
-                    player1 = self.game.input_texts["player1"]
-                    player2 = self.game.input_texts["player2"]
-                    if player1 == player2:
-                        message = "Player's names are duplicated!!"
-                        msg_surface = self.fonts.mediumFont.render(message, True, Colors.RED)
-                        msg_rect = msg_surface.get_rect(center=(self.game.width // 2, self.game.height // 2 + 60 ))
-                        self.game.screen.blit(msg_surface, msg_rect)
-                        pygame.display.flip()  # Update the display to show the message
-                        time.sleep(1.5)  # Show the message for 1 second
-                    else:
-                        self.game.current_players["X"] = self.game.input_texts["player1"]
-                        self.game.current_players["O"] = self.game.input_texts["player2"]
-                        self.game.state = GameState.GAME
-                        time.sleep(0.2)
+        if self.game.theme_manager.set_theme(theme_name):
+            self.game.renderer.clear_text_cache()  # Cached text used the old theme's colors
+
+
+    def _on_settings_done(self):
+        """Settings: goes back to the main menu."""
+
+        self.game.state = GameState.MENU
 
-                else:
-                    # Draw error message if names are not entered
-                    message = "Please enter both player names to start"
-                    msg_surface = self.fonts.mediumFont.render(message, True, Colors.RED)
-                    msg_rect = msg_surface.get_rect(center=(self.game.width // 2, self.game.height // 2 + 60 ))
-                    self.game.screen.blit(msg_surface, msg_rect)
-                    pygame.display.flip()  # Update the display to show the message
-                    time.sleep(1)  # Show the message for 1 second
+
+    def _on_scores_back(self):
+        """Scores: goes back to name entry."""
+
+        self.game.state = GameState.PLAYER_SELECTION
+        self.game.show_leaderboard = False
 
 
     def handle_game_click(self, mouse_pos):
@@ -890,81 +1494,78 @@ class EventHandler:
             and makes a move if it's valid.
         """
 
-        if ttt.terminal(self.game.board):
+        if self.game.terminal():
             return
 
-        # Calculate board positions
-        tile_size = self.game.width // 6
-        tile_origin = (self.game.width // 2 - (1.5 * tile_size),
-                       self.game.height // 2 - (1.5 * tile_size))
-
         # Check if it's the player's turn
-        current_player = ttt.player(self.game.board)
-        print(f"DEBUG: Current player: {current_player}")
-        print(f"DEBUG: Game mode: {self.game.game_mode}, AI turn: {self.game.ai_turn}, User: {self.game.user}")
+        current_player = self.game.current_player()
+        debug = logger.isEnabledFor(logging.DEBUG)  # Skip building debug messages unless they are shown
+        if debug:
+            logger.debug("Current player: %s", current_player)
+            logger.debug("Game mode: %s, AI turn: %s, User: %s", self.game.game_mode, self.game.ai_turn, self.game.user)
 
         if (self.game.game_mode == "AI" and current_player != self.game.user) or self.game.ai_turn:
-            print("DEBUG: Not the player's turn or AI is currently playing.")
+            if debug:
+                logger.debug("Not the player's turn or AI is currently playing.")
             return
 
-        # Check each tile
-        for i in range(3):
-            for j in range(3):
-                rect = pygame.Rect(
-                    tile_origin[0] + j * tile_size,
-                    tile_origin[1] + i * tile_size,
-                    tile_size, tile_size
-                )
-                if rect.collidepoint(mouse_pos) and self.game.board[i][j] == ttt.EMPTY:
-                    print("DEBUG: Tile is empty. Making a move.")
-                    self.game.board = ttt.result(self.game.board, (i, j))
-                    print(f"DEBUG: Updated board:\n{self.game.board}")
-                    # If in AI mode, set ai_turn to True
-                    if self.game.game_mode == "AI":
-                        print("DEBUG: AI's turn set to True.")
-                        self.game.ai_turn = True
-                    return
-
-    def handle_game_over_click(self, mouse_pos):
-        """Handles clicks in the game over state.
+        # The tiles form a uniform grid, so find the clicked one arithmetically from the game layout
+        layout = self.game.layout
+        tile_size = layout["tile_size"]
+        left, top = layout["tile_rects"][0].topleft
+        dx = mouse_pos[0] - left
+        dy = mouse_pos[1] - top
+        if not (0 <= dx < 3 * tile_size and 0 <= dy < 3 * tile_size):
+            return
+        i, j = dy // tile_size, dx // tile_size
+
+        if self.game.board[i][j] == ttt.EMPTY:
+            self.game.board = ttt.result(self.game.board, (i, j))
+            if debug:
+                logger.debug("Tile is empty. Made a move, updated board:\n%s", self.game.board)
+            # If in AI mode and the move didn't end the game, hand the turn to the AI
+            if self.game.game_mode == "AI" and not self.game.terminal():
+                self.game.schedule_ai_move()
+
+
+    def _on_play_again(self):
+        """Game over: restarts the game with the same players and mode."""
+
+        self.game.board = ttt.initial_state()
+        self.game.ai_turn = False
+        self.game.stats_updated = False
+        self._result_message = None
+        self.game.state = GameState.GAME
 
-        Args:
-            mouse_pos (tuple): The position of the mouse click. Checks if the player wants to play again or
-            return to the main menu.
-        """
 
-        play_again_button = pygame.Rect(self.game.width // 3 - 100, self.game.height - 65, 200, 50)
-        main_menu_button = pygame.Rect(2 * self.game.width // 3 - 100, self.game.height - 65, 200, 50)
-
-        if play_again_button.collidepoint(mouse_pos):
-            # Reset the game but keep the same players and mode
-            self.game.board = ttt.initial_state()
-            self.game.ai_turn = False
-            self.game.stats_updated = False
-            self.game.state = GameState.GAME
-            time.sleep(0.2)
-        elif main_menu_button.collidepoint(mouse_pos):
-            # Reset everything and go back to menu
-            self.game.game_mode = None
-            self.game.user = None
-            self.game.board = ttt.initial_state()
-            self.game.ai_turn = False
-            self.game.show_leaderboard = False
-            self.game.stats_updated = False
-            self.game.current_players = {"X": None, "O": None}
-            self.game.state = GameState.MENU
-            time.sleep(0.2)
+    def _on_main_menu(self):
+        """Game over: resets everything and goes back to the main menu."""
+
+        self.game.game_mode = None
+        self.game.user = None
+        self.game.board = ttt.initial_state()
+        self.game.ai_turn = False
+        self.game.show_leaderboard = False
+        self.game.stats_updated = False
+        self._result_message = None
+        self.game.current_players = {"X": None, "O": None}
+        self.game.state = GameState.MENU
 
 
     def handle_game_result(self):
         """Determines the result of the game and updates player stats if necessary.
 
         Determines if the game ended in a win or a tie and updates the player statistics accordingly.
+        The message is kept until the game is left, so later calls return it without touching the stats.
+
         Returns:
             str: A message summarizing the game result, such as "Game Over: Tie!" or "Game Over: [Player] wins!".
         """
 
-        winner = ttt.winner(self.game.board)
+        if self._result_message is not None:
+            return self._result_message
+
+        winner = self.game.winner()
         if winner is None:
             message = "Game Over: Tie!"
 
@@ -975,12 +1576,13 @@ class EventHandler:
         else:
             if self.game.game_mode == "2P" and not self.game.stats_updated:
                 winner_name = self.game.current_players[winner]
-                loser_symbol = "O" if winner == "X" else "X"
+                loser_symbol = OPPONENT[winner]
                 loser_name = self.game.current_players[loser_symbol]
                 self.game.storage_manager.update_player_stats(winner_name, won=True)
                 self.game.storage_manager.update_player_stats(loser_name, won=False)
                 self.game.stats_updated = True
             message = f"Game Over: {self.game.current_players[winner]} wins!"
+        self._result_message = message
         return message
 
 
@@ -991,8 +1593,22 @@ class Fonts:
         mediumFont (pygame.font.Font): A medium-sized font, typically used for buttons and smaller text.
         largeFont (pygame.font.Font): A large-sized font, typically used for titles and headings.
         moveFont (pygame.font.Font): A large-sized font used for displaying moves (X and O) on the game board.
+        static (dict): Rendered text surfaces keyed by (text, font id, color).
+
+    Methods:
+        render_cached(text, font, color):
+            Returns a rendered text surface, rendering it only the first time it is requested.
+
+        preload(font, color, texts):
+            Renders a batch of labels ahead of time.
+
+        clear_static():
+            Drops the rendered text surfaces, keeping only the theme-independent labels.
     """
 
+    # Labels whose color doesn't depend on the theme, rendered in red at startup
+    ERROR_LABELS = ("Please enter both player names to start", "Player's names are duplicated!!")
+
     def __init__(self):
         """Initializes the Fonts object, loading font resources with specific sizes."""
 
@@ -1001,20 +1617,71 @@ class Fonts:
         self.largeFont = pygame.font.Font("OpenSans-Regular.ttf", 40)
         self.moveFont = pygame.font.Font("OpenSans-Regular.ttf", 60)
 
+        self.static = {}
+        self.preload(self.mediumFont, Colors.RED, self.ERROR_LABELS)
+
+
+    def render_cached(self, text, font, color):
+        """Returns a rendered text surface, rendering it only the first time it is requested.
+
+        Args:
+            text (str): The text to render.
+            font (pygame.font.Font): The font object for rendering.
+            color (tuple): The RGB color of the text.
+
+        Returns:
+            pygame.Surface: The cached surface for the text.
+        """
+
+        key = (text, id(font), tuple(color))
+        surface = self.static.get(key)
+        if surface is None:
+            # Match the display's pixel format so later blits take SDL's fast path
+            surface = font.render(text, True, color).convert_alpha()
+            self.static[key] = surface
+        return surface
+
+
+    def preload(self, font, color, texts):
+        """Renders a batch of labels ahead of time, so screens don't rasterize text on their first frame.
+
+        Args:
+            font (pygame.font.Font): The font object for rendering.
+            color (tuple): The RGB color of the text.
+            texts (iterable): The labels to render.
+        """
+
+        for text in texts:
+            self.render_cached(text, font, color)
+
+
+    def clear_static(self):
+        """Drops the rendered text surfaces, keeping only the theme-independent labels."""
+
+        self.static.clear()
+        self.preload(self.mediumFont, Colors.RED, self.ERROR_LABELS)
+
 
 class TicTacToeGame:
     """Represents the main Tic-Tac-Toe game, including initialization, game state management, and the main loop.
 
     Attributes:
+        headless (bool): Whether the game runs on SDL's dummy video driver without drawing frames, set by
+            HEADLESS=1 (or true/yes/on).
         size (tuple): The dimensions of the game window.
         width (int): The width of the game window.
         height (int): The height of the game window.
         screen (pygame.Surface): The main game display surface.
+        layout (dict): Screen positions and button rects for the window size, see Renderer.compute_layout().
+        clock (pygame.time.Clock): Paces the main loop to the frame rate.
         fonts (Fonts): The font manager for rendering text.
         game_mode (str): The current game mode, either None, "AI", or "2P".
         user (str): The user/player's symbol, either "X" or "O".
         board (list): The current game board state.
         ai_turn (bool): Whether it's the AI's turn.
+        ai_move_at (int): The `pygame.time.get_ticks()` time at which the pending AI move is played.
+        ai_result (queue.Queue): (generation, move) pairs posted by the AI worker thread.
+        ai_generation (int): Bumped on every board assignment, so moves searched for an older board are ignored.
         show_leaderboard (bool): Whether the leaderboard is being displayed.
         state (GameState): The current game state.
         stats_updated (bool): Whether player statistics have been updated after a game.
@@ -1028,25 +1695,70 @@ class TicTacToeGame:
         active_input (str): The currently active input box.
         input_labels (dict): Labels for the input boxes.
         current_players (dict): Maps "X" and "O" to player names.
+        notifications (list): Notifications shown below the name inputs until they expire.
 
     Methods:
+        terminal():
+            Returns whether the current board is finished, computed once per board.
+
+        current_player():
+            Returns the player to move on the current board, computed once per board.
+
+        winner():
+            Returns the winner of the current board, computed once per board.
+
+        schedule_ai_move(delay_ms):
+            Hands the turn to the AI and starts its search on a worker thread.
+
+        update_ai():
+            Plays the AI's move when it is due.
+
+        update_game_over():
+            Ends the game and records its result once the board is finished.
+
         run():
             The main game loop, continuously handling events and rendering the game.
     """
 
+    # The attribute set is fixed, so instances get slots instead of a per-instance __dict__
+    __slots__ = (
+        "headless", "size", "width", "height", "screen", "layout", "clock", "fonts",
+        "game_mode", "user", "_board", "_board_cache", "ai_turn", "ai_move_at", "ai_result", "ai_generation",
+        "show_leaderboard", "state",
+        "stats_updated", "current_theme",
+        "theme_manager", "storage_manager", "renderer", "event_handler",
+        "input_boxes", "input_texts", "active_input", "input_labels", "current_players",
+        "notifications",
+    )
+
     def __init__(self):
         """Initializes the Tic-Tac-Toe game."""
 
-        pygame.init()
+        logging.basicConfig(level=logging.WARNING)  # Debug output stays off unless configured otherwise
+        # Automated runs (AI benchmarks, tests) don't need a window; SDL reads the driver when the display starts
+        self.headless = os.environ.get("HEADLESS", "").strip().lower() in ("1", "true", "yes", "on")
+        if self.headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+        # Only the subsystems the game uses; pygame.init() would also start audio and joystick support
+        pygame.display.init()  # Also starts SDL's event handling
+        pygame.font.init()
+        self.clock = pygame.time.Clock()  # Creating the clock starts the SDL timer behind pygame.time.get_ticks()
         self.size = self.width, self.height = 800, 600
-        self.screen = pygame.display.set_mode(self.size)
+        self.screen = pygame.display.set_mode(self.size, 0, 32)  # 32-bit display for the fast blit paths
+        # Only queue the events handle_events() acts on, so mouse motion and window events neither fill the
+        # queue nor wake the loop from pygame.event.wait()
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, *REDRAW_EVENTS])
         self.fonts = Fonts()
 
         # GameState
         self.game_mode = None  # None, "AI", "2P"
         self.user = None
+        self.ai_generation = 0
         self.board = ttt.initial_state()
         self.ai_turn = False
+        self.ai_move_at = 0
+        self.ai_result = queue.Queue()
         self.show_leaderboard = False
         self.state = GameState.MENU
         self.stats_updated = False
@@ -1057,8 +1769,11 @@ class TicTacToeGame:
         self.storage_manager = StorageManager()
         self.storage_manager.initialize_storage()
         
-        self.renderer = Renderer(self, self.screen, self.theme_manager, self.fonts, self.state)
-        self.event_handler = EventHandler(self, self.fonts, self.state)
+        # Both read the game state from the game itself, so there is a single source of truth
+        self.renderer = Renderer(self, self.screen, self.theme_manager, self.fonts)
+        self.event_handler = EventHandler(self, self.fonts)
+        # The window has a fixed size, so the layout is computed once and per-frame drawing and clicks never redo the math
+        self.layout = self.renderer.compute_layout(self.width, self.height)
         
         # Input attributes for player names
         self.input_boxes = {
@@ -1071,17 +1786,156 @@ class TicTacToeGame:
 
         self.current_players = {"X": None, "O": None}
 
+        # Error messages drawn by the renderer until they expire
+        self.notifications = []
+
+
+    @property
+    def board(self):
+        """list: The current game board state. Assigning a new board drops the cached board queries and
+        bumps `ai_generation`."""
+
+        return self._board
+
+
+    @board.setter
+    def board(self, value):
+        self._board = value
+        self._board_cache = {}
+        self.ai_generation += 1
+
+
+    def terminal(self):
+        """Returns whether the game on the current board is over.
+
+        The renderer, the click handlers and the AI all ask about the same board every frame, so the answer is
+        computed once per board.
+
+        Returns:
+            bool: True if the game is over, False otherwise.
+        """
+
+        cache = self._board_cache
+        if "terminal" not in cache:
+            cache["terminal"] = ttt.terminal(self._board)
+        return cache["terminal"]
+
+
+    def current_player(self):
+        """Returns the player who has the next turn on the current board, computed once per board.
+
+        Returns:
+            str: "X" or "O".
+        """
+
+        cache = self._board_cache
+        if "player" not in cache:
+            cache["player"] = ttt.player(self._board)
+        return cache["player"]
+
+
+    def winner(self):
+        """Returns the winner on the current board, computed once per board.
+
+        Returns:
+            str or None: "X" or "O" if that player has won, None otherwise.
+        """
+
+        cache = self._board_cache
+        if "winner" not in cache:
+            cache["winner"] = ttt.winner(self._board)
+        return cache["winner"]
+
+
+    def schedule_ai_move(self, delay_ms=200):
+        """Hands the turn to the AI and starts its search on a worker thread.
+
+        The move is played once the delay has passed and the search has finished, which keeps the
+        "Computer Thinking..." status visible without blocking the main loop.
+
+        Args:
+            delay_ms (int): Milliseconds to wait before the AI plays. Defaults to 200.
+        """
+
+        self.ai_turn = True
+        self.ai_move_at = pygame.time.get_ticks() + delay_ms
+        board, generation = self.board, self.ai_generation
+        # Post the generation along with the move, so a search for a board that was left in the meantime is ignored
+        threading.Thread(target=lambda: self.ai_result.put((generation, ttt.minimax(board))), daemon=True).start()
+
+
+    def update_ai(self):
+        """Plays the AI's move when it is due.
+
+        Called once per frame from the main loop. Schedules the AI's move when it has to play (e.g. when the
+        user chose O) and applies the move found by the worker thread once `ai_move_at` has passed.
+        """
+
+        if self.state != GameState.GAME or self.game_mode != "AI":
+            return
+        if self.terminal() or self.current_player() == self.user:
+            return
+        if not self.ai_turn:
+            self.schedule_ai_move()
+            return
+
+        if pygame.time.get_ticks() < self.ai_move_at:
+            return
+        while True:
+            try:
+                generation, move = self.ai_result.get_nowait()
+            except queue.Empty:
+                return  # Still searching
+            if generation == self.ai_generation:
+                break
+            # A search for a board that was reset or left since; the current search is still pending
+        self.board = ttt.result(self.board, move)
+        self.ai_turn = False
+
+
+    def update_game_over(self):
+        """Ends the game and records its result once the board is finished.
+
+        Called once per frame from the main loop rather than from the renderer, so finished games are
+        recorded in headless runs too.
+        """
+
+        if self.state == GameState.GAME and self.terminal():
+            self.state = GameState.GAME_OVER
+            self.event_handler.handle_game_result()
+
 
     def run(self):
         """The main game loop.
 
-        Continuously handles user input, updates the game state, and renders the screen.
+        Continuously handles user input, updates the game state, and renders the screen. Each iteration drains the
+        whole event queue once and is capped at 60 frames per second during gameplay and 30 elsewhere instead of
+        spinning. Outside of gameplay nothing animates, so the loop sleeps in pygame.event.wait() until input arrives,
+        waking every 100 ms for timers such as error messages and the stats flush.
         """
 
+        # Objects created at start-up live for the whole session, so keep them out of cyclic collections, and
+        # collect the young generation rarely so frames don't hitch on the collector
+        gc.freeze()
+        gc.set_threshold(100000, 100, 100)
+
         while True:
-            self.event_handler.handle_events()
-            self.renderer.render()
-            pygame.display.flip()
+            if self.state == GameState.GAME:
+                events = None
+            else:
+                event = pygame.event.wait(timeout=100)
+                # Keep the woken-up event first, followed by anything queued behind it
+                events = [] if event.type == pygame.NOEVENT else [event]
+                events.extend(pygame.event.get())
+            self.event_handler.handle_events(events)
+            self.update_ai()
+            self.update_game_over()
+            if not self.headless:  # Nothing is shown on the dummy driver, so skip drawing altogether
+                self.renderer.render()
+                self.renderer.present()
+            self.storage_manager.maybe_flush()
+            # Nothing animates outside of gameplay, so menus are capped lower
+            self.clock.tick(60 if self.state == GameState.GAME else 30)
 
 
 if __name__ == "__main__":
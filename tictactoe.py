@@ -3,9 +3,10 @@ Tic Tac Toe Player
  Tic Tac Toe game implementation with an AI opponent using the minimax algorithm.
 
 This module provides a complete implementation of a Tic Tac Toe game, including game state 
-management and an AI player that makes optimal moves using the minimax algorithm with 
-alpha-beta pruning. The game board is represented as a 3x3 list of lists, where each cell 
-contains either 'X', 'O', or None (empty).
+management and an AI player that makes optimal moves using the minimax algorithm. minimax() packs
+the board into a pair of player bitmasks and memoizes position values, so the whole game tree is
+solved once. The game board is represented as a 3x3 list of lists, where each cell contains either 'X', 'O',
+or None (empty).
 
 https://www.geeksforgeeks.org/minimax-algorithm-in-game-theory-set-1-introduction/
 https://papers-100-lines.medium.com/the-minimax-algorithm-and-alpha-beta-pruning-tutorial-in-30-lines-of-python-code-e4a3d97fa144
@@ -14,15 +15,49 @@ Global Constants:
     X (str): Represents the X player
     O (str): Represents the O player
     EMPTY (None): Represents an empty cell
+    WIN_MASKS (tuple): Bitmasks of the 8 winning lines, with bit i*3+j standing for cell (i, j)
+    FULL_MASK (int): Bitmask with all 9 cells set
 """
 
-import math
-import copy 
+from functools import lru_cache
 
 X = "X"
 O = "O"
 EMPTY = None
 
+# Rows, columns and both diagonals as 9-bit masks over the cells
+WIN_MASKS = (0b000000111, 0b000111000, 0b111000000,
+             0b001001001, 0b010010010, 0b100100100,
+             0b100010001, 0b001010100)
+FULL_MASK = 0b111111111
+
+
+def _symmetry_tables():
+    """
+    Builds the mask tables for the 8 symmetries of the board (4 rotations, each optionally mirrored).
+
+    Returns:
+        tuple: 8 tables, each mapping every 9-bit cell mask (0-511) to its image under one symmetry.
+    """
+    tables = []
+    for mirrored in (False, True):
+        for turns in range(4):
+            # Where each cell bit i*3+j ends up
+            target = []
+            for i in range(3):
+                for j in range(3):
+                    a, b = (i, 2 - j) if mirrored else (i, j)
+                    for _ in range(turns):
+                        a, b = b, 2 - a
+                    target.append(a * 3 + b)
+            tables.append(tuple(
+                sum(1 << target[k] for k in range(9) if mask >> k & 1) for mask in range(FULL_MASK + 1)
+            ))
+    return tuple(tables)
+
+
+_SYMMETRIES = _symmetry_tables()
+
 
 def initial_state():
     """
@@ -36,6 +71,51 @@ def initial_state():
             [EMPTY, EMPTY, EMPTY]]
 
 
+def _masks(board):
+    """
+    Packs the board into one bitmask per player.
+
+    Args:
+        board (list): The current game board state.
+
+    Returns:
+        tuple: (x_mask, o_mask), where bit i*3+j is set if that player holds cell (i, j).
+    """
+    x_mask = o_mask = 0
+    bit = 1
+    for row in board:
+        for cell in row:
+            if cell == X:
+                x_mask |= bit
+            elif cell == O:
+                o_mask |= bit
+            bit <<= 1
+    return x_mask, o_mask
+
+
+@lru_cache(maxsize=None)
+def _mask_winner(x_mask, o_mask):
+    """
+    Returns the winner for a board packed with _masks, if there is one.
+
+    Memoized on the mask pair, which identifies the position: repeated winner/terminal checks on the
+    same board are a cache hit instead of 8 mask tests.
+
+    Args:
+        x_mask (int): Cells held by X.
+        o_mask (int): Cells held by O.
+
+    Returns:
+        str or None: 'X' if X has won, 'O' if O has won, None if no winner.
+    """
+    for w in WIN_MASKS:
+        if x_mask & w == w:
+            return X
+        if o_mask & w == w:
+            return O
+    return None
+
+
 def player(board):
     """
     Returns player who has the next turn on a board.
@@ -49,10 +129,9 @@ def player(board):
     """
     # if board == initial_state():
     #     return X
-    x = sum(row.count(X) for row in board)
-    o = sum(row.count(O) for row in board)
+    x_mask, o_mask = _masks(board)
     
-    if x > o:
+    if x_mask.bit_count() > o_mask.bit_count():
         return O
     else:
         return X
@@ -60,22 +139,18 @@ def player(board):
 
 def actions(board):
     """
-    Returns set of all possible actions (i, j) available on the board.
+    Returns all possible actions (i, j) available on the board.
     
     Args:
         board (list): The current game board state.
         
     Returns:
-        set: A set of tuples (i, j) representing all empty cells where i is the row 
+        list: Tuples (i, j) representing all empty cells in row-major order, where i is the row 
              index (0-2) and j is the column index (0-2).
              
     """
-    act = set()
-    for i in range(0,3):
-        for j in range(0, 3):
-            if board[i][j] == EMPTY:
-                act.add((i, j))
-    return act
+    # EMPTY is None, so an identity test skips the rich comparison
+    return [(i, j) for i in range(3) for j in range(3) if board[i][j] is EMPTY]
 
 
 def result(board, action):
@@ -93,11 +168,17 @@ def result(board, action):
         Exception: If the action is not valid for the current board.
         
     """
-    if action not in actions(board):
+    # Only the empty cells are valid moves, same as actions(board) but without building the list
+    try:
+        (i, j) = action
+        valid = 0 <= i < 3 and 0 <= j < 3 and board[i][j] == EMPTY
+    except (TypeError, ValueError):
+        valid = False
+    if not valid:
         raise Exception("Invalid action")
      
-    newBoard = copy.deepcopy(board)
-    (i, j) = action
+    # Cells are immutable strings/None, so copying the rows is enough
+    newBoard = [row[:] for row in board]
     newBoard[i][j] = player(board)
     
     return newBoard   
@@ -107,8 +188,8 @@ def winner(board):
     """
     Returns the winner of the game, if there is one.
     
-    Checks all rows, columns (using transpose), and both diagonals for three in a row
-    of either X or O.
+    Checks all rows, columns, and both diagonals for three in a row of either X or O,
+    by testing each player's bitmask against WIN_MASKS.
     
     Args:
         board (list): The current game board state.
@@ -116,25 +197,7 @@ def winner(board):
     Returns:
         str or None: 'X' if X has won, 'O' if O has won, None if no winner.
     """
-    # transpose list of lists #  **** 
-    def transpose(board): 
-        return [list(sub) for sub in zip(*board)]
-    # checking
-    def checkin(board):
-        #check row 
-        for row in board:
-            if all(cell == X for cell in row):
-                return X
-            if all(cell == O for cell in row):
-                return O
-        # check diag
-        if (board[0][0] == board[1][1] == board[2][2]) and board[0][0] is not EMPTY:
-            return board[0][0] 
-        if (board[2][0] == board[1][1] == board[0][2]) and board[2][0] is not EMPTY:
-            return board[2][0]
-        return None
-
-    return checkin(board) or checkin(transpose(board))
+    return _mask_winner(*_masks(board))
 
 
 def terminal(board):
@@ -153,9 +216,8 @@ def terminal(board):
     Returns:
         bool: True if game is over, False otherwise.
     """
-    if (winner(board) is not None) or (not any(None in row for row in board)):
-        return True
-    return False
+    x_mask, o_mask = _masks(board)
+    return _mask_winner(x_mask, o_mask) is not None or (x_mask | o_mask) == FULL_MASK
 
 
 def utility(board):
@@ -170,9 +232,10 @@ def utility(board):
         This utility function is used by the minimax algorithm to evaluate board states.
         
     """
-    if winner(board) == X:
+    win = winner(board)
+    if win == X:
         return 1
-    elif winner(board) == O:
+    elif win == O:
         return -1
     else:
         return 0
@@ -191,86 +254,85 @@ def minimax(board):
         For O (minimizing player), chooses the move with the lowest minimax value.
         
     """
-    if terminal(board):
-        return None
-    
-    mx = float('-inf')
-    mn = float('inf')
-
-    # Check if there's a winning move available for the board
-    for act in actions(board):
-        result_board = result(board, act)
-        if terminal(result_board) and winner(result_board) == player(board):
-            return act
-
-    if player(board) == X:
-        return max_val(board, mx, mn)[1]
-    else:
-        return min_val(board, mx, mn)[1]
+    # Boards are lists, so key the cache on the hashable pair of player bitmasks
+    return _minimax_cached(*_masks(board))
 
 
-def max_val(board, alpha, beta):
+@lru_cache(maxsize=None)
+def _minimax_cached(x_mask, o_mask):
     """
-    Function for minimax that handles maximizing player's turns.
+    Memoized body of minimax, keyed by the board's player bitmasks.
+
+    Tic Tac Toe has only a few thousand reachable positions, so after warm-up every AI move
+    is a cache lookup.
 
     Args:
-        board (list): The current game board state.
-        alpha (float): Alpha value for alpha-beta pruning.
-        beta (float): Beta value for alpha-beta pruning.
-        
+        x_mask (int): Cells held by X, as packed by _masks.
+        o_mask (int): Cells held by O, as packed by _masks.
+
     Returns:
-        list: A list containing [best_value, best_action], where best_value is the minimax
-              value of the optimal move and best_action is the corresponding move.
+        tuple or None: The optimal move (i, j), or None if the game is over.
     """
-    if terminal(board):
-        return [utility(board), None]
-        
-    best_val = float('-inf')
-    best_act = None
-    
-    for act in actions(board):
-        # Get value / simulate from minimizer's turn
-        val = min_val(result(board, act), alpha, beta)[0]
-        alpha = max(alpha, val)
+    if _mask_winner(x_mask, o_mask) is not None or (x_mask | o_mask) == FULL_MASK:
+        return None
 
-        if val > best_val:
-            best_val = val
-            best_act = act
+    x_turn = x_mask.bit_count() == o_mask.bit_count()
+    moves = [1 << k for k in range(9) if not (x_mask | o_mask) >> k & 1]
 
-        if alpha >= beta:
-            break
+    # Check if there's a winning move available for the board
+    for bit in moves:
+        if x_turn and _mask_winner(x_mask | bit, o_mask) == X:
+            return divmod(bit.bit_length() - 1, 3)
+        if not x_turn and _mask_winner(x_mask, o_mask | bit) == O:
+            return divmod(bit.bit_length() - 1, 3)
+
+    if x_turn:
+        best = max(moves, key=lambda bit: _value(x_mask | bit, o_mask))
+    else:
+        best = min(moves, key=lambda bit: _value(x_mask, o_mask | bit))
+    return divmod(best.bit_length() - 1, 3)
 
-    return [best_val, best_act]
 
-def min_val(board, alpha, beta):
+def _value(x_mask, o_mask):
     """
-    Helper function for minimax that handles minimizing player's turns.
-    
+    Returns the minimax value of a board packed with _masks, with optimal play from both sides.
+
+    Rotating or mirroring a board doesn't change its value, so positions are looked up by their
+    canonical form: the 8 symmetric variants of a position share one cache entry in _canonical_value.
+
     Args:
-        board (list): The current game board state.
-        alpha (float): Alpha value for alpha-beta pruning.
-        beta (float): Beta value for alpha-beta pruning.
-        
+        x_mask (int): Cells held by X.
+        o_mask (int): Cells held by O.
+
     Returns:
-        list: A list containing [best_value, best_action], where best_value is the minimax
-              value of the optimal move and best_action is the corresponding move.
+        int: 1 if X wins, -1 if O wins, 0 for a draw.
     """
-    if terminal(board):
-        return [utility(board), None]
-        
-    best_val = float('inf')
-    best_act = None
+    return _canonical_value(*min((table[x_mask], table[o_mask]) for table in _SYMMETRIES))
 
-    for act in actions(board):
 
-        val = max_val(result(board, act), alpha, beta)[0]
-        beta = min(beta, val)
-            
-        if val < best_val:
-            best_val = val
-            best_act = act
+@lru_cache(maxsize=None)
+def _canonical_value(x_mask, o_mask):
+    """
+    Memoized body of _value, keyed by the canonical mask pair of a position.
 
-        if alpha >= beta:
-            break
+    Every position is evaluated once and then served from the cache, so no alpha-beta pruning
+    is needed: the whole game tree is only a few hundred positions up to symmetry.
+
+    Args:
+        x_mask (int): Cells held by X, in canonical form.
+        o_mask (int): Cells held by O, in canonical form.
+
+    Returns:
+        int: 1 if X wins, -1 if O wins, 0 for a draw.
+    """
+    win = _mask_winner(x_mask, o_mask)
+    if win is not None:
+        return 1 if win == X else -1
+    occupied = x_mask | o_mask
+    if occupied == FULL_MASK:
+        return 0
 
-    return [best_val, best_act]
\ No newline at end of file
+    free = [1 << k for k in range(9) if not occupied >> k & 1]
+    if x_mask.bit_count() == o_mask.bit_count():
+        return max(_value(x_mask | bit, o_mask) for bit in free)
+    return min(_value(x_mask, o_mask | bit) for bit in free)